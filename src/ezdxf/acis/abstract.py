@@ -1,9 +1,9 @@
 #  Copyright (c) 2022-2024, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import TypeVar, Generic, TYPE_CHECKING, Optional
+from typing import TypeVar, Generic, TYPE_CHECKING, Optional, Iterator, Any
 from abc import ABC, abstractmethod
-from .const import NULL_PTR_NAME, MIN_EXPORT_VERSION
+from .const import NULL_PTR_NAME, MIN_EXPORT_VERSION, Features
 from .hdr import AcisHeader
 
 if TYPE_CHECKING:
@@ -17,6 +17,7 @@ T = TypeVar("T", bound="AbstractEntity")
 class AbstractEntity(ABC):
     """Unified query interface for SAT and SAB data."""
 
+    __slots__ = ()
     name: str
     id: int = -1
 
@@ -36,6 +37,15 @@ class DataLoader(ABC):
     """
 
     version: int = MIN_EXPORT_VERSION
+    # The version of a data loader does not change, so the supported features
+    # are evaluated once at initialization:
+    has_pattern: bool = MIN_EXPORT_VERSION >= Features.PATTERN
+    has_tol_modeling: bool = MIN_EXPORT_VERSION >= Features.TOL_MODELING
+
+    def reset(self, data: Any) -> None:
+        """Reset loader for new `data`."""
+        self.data = data
+        self.index = 0
 
     @abstractmethod
     def has_data(self) -> bool:
@@ -57,7 +67,7 @@ class DataLoader(ABC):
         pass
 
     @abstractmethod
-    def read_vec3(self) -> tuple[float, float, float]:
+    def read_vec3(self) -> Vec3:
         pass
 
     @abstractmethod
@@ -119,6 +129,10 @@ class DataExporter(ABC):
     def write_ptr(self, entity: AcisEntity) -> None:
         pass
 
+    def write_ptrs(self, *entities: AcisEntity) -> None:
+        for entity in entities:
+            self.write_ptr(entity)
+
     @abstractmethod
     def write_transform(self, data: list[str]) -> None:
         pass
@@ -128,6 +142,20 @@ class AbstractBuilder(Generic[T]):
     header: AcisHeader
     bodies: list[T]
     entities: list[T]
+    _entities_by_name: dict[str, list[T]]
+
+    def set_entities(self, entities: list[T]) -> None:
+        """Reset entities and bodies list. (internal API)"""
+        entities_by_name: dict[str, list[T]] = {}
+        for e in entities:
+            entities_by_name.setdefault(e.name, []).append(e)
+        self._entities_by_name = entities_by_name
+        self.bodies = list(entities_by_name.get("body", []))
+        self.entities = entities
+
+    def query_type(self, name: str) -> Iterator[T]:
+        """Returns an iterator of all entities of type `name`."""
+        return iter(self._entities_by_name.get(name, []))
 
     def reorder_records(self) -> None:
         if len(self.entities) == 0:
@@ -196,8 +224,10 @@ class EntityExporter(Generic[T]):
             return False
 
         entities = [entity]
-        while entities:
-            next_entity = entities.pop(0)
+        index = 0  # queue pointer, avoids the O(n) list.pop(0)
+        while index < len(entities):
+            next_entity = entities[index]
+            index += 1
             add(next_entity)
             for sub_entity in next_entity.entities():
                 if add(sub_entity):
@@ -216,8 +246,10 @@ class EntityExporter(Generic[T]):
 
         entities = [entity]
         done: set[int] = set()
-        while entities:
-            next_entity = entities.pop(0)
+        index = 0  # queue pointer, avoids the O(n) list.pop(0)
+        while index < len(entities):
+            next_entity = entities[index]
+            index += 1
             _export_record(next_entity)
             for sub_entity in next_entity.entities():
                 if _export_record(sub_entity):
@@ -1,7 +1,7 @@
 #  Copyright (c) 2022-2024, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import Iterator, Callable, Any
+from typing import Iterator, Callable, Any, Optional
 from .entities import (
     AcisEntity,
     NONE_REF,
@@ -18,6 +18,8 @@ class AcisDebugger:
         self._next_id = start_id - 1
         self._root: AcisEntity = root
         self.entities: dict[int, AcisEntity] = dict()
+        # lazy evaluated index of entity types of the root structure
+        self._type_index: Optional[dict[str, list[AcisEntity]]] = None
         if not root.is_none:
             self._store_entities(root)
 
@@ -30,12 +32,22 @@ class AcisDebugger:
         return self._next_id
 
     def _store_entities(self, entity: AcisEntity) -> None:
+        self._type_index = None
         if not entity.is_none and entity.id == -1:
             entity.id = self._get_id()
         self.entities[entity.id] = entity
-        for e in vars(entity).values():
-            if isinstance(e, AcisEntity) and e.id == -1:
-                self._store_entities(e)
+        # iterative depth-first traversal, same order as a recursive traversal
+        stack = [e for e in entity.entities() if e.id == -1]
+        stack.reverse()
+        while stack:
+            entity = stack.pop()
+            if entity.id != -1:  # already stored
+                continue
+            entity.id = self._get_id()
+            self.entities[entity.id] = entity
+            sub_entities = [e for e in entity.entities() if e.id == -1]
+            sub_entities.reverse()
+            stack.extend(sub_entities)
 
     def set_entities(self, entity: AcisEntity) -> None:
         self.entities.clear()
@@ -43,19 +55,20 @@ class AcisDebugger:
         self._store_entities(entity)
 
     def walk(self, root: AcisEntity = NONE_REF) -> Iterator[AcisEntity]:
-        def _walk(entity: AcisEntity):
-            if entity.is_none:
-                return
-            yield entity
-            done.add(entity.id)
-            for e in vars(entity).values():
-                if isinstance(e, AcisEntity) and e.id not in done:
-                    yield from _walk(e)
-
         if root.is_none:
             root = self._root
         done: set[int] = set()
-        yield from _walk(root)
+        # iterative depth-first traversal, same order as a recursive traversal
+        stack = [root]
+        while stack:
+            entity = stack.pop()
+            if entity.is_none or entity.id in done:
+                continue
+            yield entity
+            done.add(entity.id)
+            sub_entities = [e for e in entity.entities() if e.id not in done]
+            sub_entities.reverse()
+            stack.extend(sub_entities)
 
     def filter(
         self, func: Callable[[AcisEntity], bool], entity: AcisEntity = NONE_REF
@@ -67,16 +80,33 @@ class AcisDebugger:
     def filter_type(
         self, name: str, entity: AcisEntity = NONE_REF
     ) -> Iterator[Any]:
-        if entity.is_none:
-            entity = self._root
-        yield from filter(lambda x: x.type == name, self.walk(entity))
+        """Yields all entities of type `name` linked to `entity`, the default entity
+        is the root entity.
+
+        The entity types of the root structure are indexed at the first call, call
+        :meth:`set_entities` after modifying the entity structure of the root entity.
+        """
+        if entity.is_none or entity is self._root:
+            yield from self._get_type_index().get(name, [])
+        else:
+            yield from filter(lambda x: x.type == name, self.walk(entity))
+
+    def _get_type_index(self) -> dict[str, list[AcisEntity]]:
+        type_index = self._type_index
+        if type_index is None:
+            type_index = dict()
+            for e in self.walk(self._root):
+                type_index.setdefault(e.type, []).append(e)
+            self._type_index = type_index
+        return type_index
 
     @staticmethod
     def entity_attributes(entity: AcisEntity, indent: int = 0) -> Iterator[str]:
         indent_str = " " * indent
-        for name, data in vars(entity).items():
+        for name in entity._slot_names:
             if name == "id":
                 continue
+            data = getattr(entity, name)
             yield f"{indent_str}{name}: {data}"
 
     def face_link_structure(self, face: Face, indent: int = 0) -> Iterator[str]:
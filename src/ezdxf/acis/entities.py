@@ -5,14 +5,15 @@ from typing import Callable, Type, Any, Sequence, Iterator
 import abc
 
 from . import sab, sat, const, hdr
-from .const import Features
 from .abstract import DataLoader, AbstractEntity, DataExporter
 from .type_hints import EncodedData
 from ezdxf.math import Matrix44, Vec3, NULLVEC
 
 Factory = Callable[[AbstractEntity], "AcisEntity"]
+RestoreFunction = Callable[[DataLoader, Factory], Any]
 
 ENTITY_TYPES: dict[str, Type[AcisEntity]] = {}
+_get_entity_type = ENTITY_TYPES.get
 INF = float("inf")
 
 
@@ -22,9 +23,10 @@ def load(data: EncodedData) -> list[Body]:
     and :term:`SAB` data as bytes or bytearray.
 
     """
-    if isinstance(data, (bytes, bytearray)):
-        return SabLoader.load(data)
-    return SatLoader.load(data)
+    loader = _LOADERS.get(type(data))
+    if loader is None:  # subclasses of the supported types
+        loader = SabLoader if isinstance(data, (bytes, bytearray)) else SatLoader
+    return loader.load(data)
 
 
 def export_sat(
@@ -87,10 +89,12 @@ def register(cls):
 
 class NoneEntity:
     type: str = const.NONE_ENTITY_NAME
+    __slots__ = ()
 
     @property
     def is_none(self) -> bool:
-        return self.type == const.NONE_ENTITY_NAME
+        # NONE_REF is the only instance of NoneEntity
+        return self is NONE_REF
 
 
 NONE_REF: Any = NoneEntity()
@@ -109,8 +113,17 @@ class AcisEntity(NoneEntity):
     """
 
     type: str = "unsupported-entity"
-    id: int = -1
-    attributes: AcisEntity = NONE_REF
+    __slots__ = ("id", "attributes")
+    # names of all slots of the class including the slots of the base classes
+    _slot_names: tuple[str, ...] = __slots__
+
+    def __init__(self) -> None:
+        self.id: int = -1
+        self.attributes: AcisEntity = NONE_REF
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._slot_names = cls._slot_names + cls.__dict__.get("__slots__", ())
 
     def __str__(self) -> str:
         return f"{self.type}({self.id})"
@@ -149,52 +162,116 @@ class AcisEntity(NoneEntity):
 
     def entities(self) -> Iterator[AcisEntity]:
         """Yield all attributes of this entity of type AcisEntity."""
-        for e in vars(self).values():
+        for name in self._slot_names:
+            e = getattr(self, name)
             if isinstance(e, AcisEntity):
                 yield e
 
 
+def _make_restore_function(expected_type: str) -> RestoreFunction:
+    """Returns a function to restore an entity pointer of the given entity type."""
+    null_ptr_name = const.NULL_PTR_NAME
+
+    def restore(loader: DataLoader, entity_factory: Factory) -> Any:
+        raw_entity = loader.read_ptr()
+        name = raw_entity.name
+        if name == null_ptr_name:
+            return NONE_REF
+        # Most names match the expected type exactly, the suffix check is
+        # required for subtypes like "plane-surface":
+        if name == expected_type or name.endswith(expected_type):
+            return entity_factory(raw_entity)
+        raise const.ParsingError(
+            f"expected entity type '{expected_type}', got '{name}'"
+        )
+
+    return restore
+
+
+_restore_body = _make_restore_function("body")
+_restore_coedge = _make_restore_function("coedge")
+_restore_curve = _make_restore_function("curve")
+_restore_edge = _make_restore_function("edge")
+_restore_face = _make_restore_function("face")
+_restore_loop = _make_restore_function("loop")
+_restore_lump = _make_restore_function("lump")
+_restore_pattern = _make_restore_function("pattern")
+_restore_pcurve = _make_restore_function("pcurve")
+_restore_point = _make_restore_function("point")
+_restore_shell = _make_restore_function("shell")
+_restore_subshell = _make_restore_function("subshell")
+_restore_surface = _make_restore_function("surface")
+_restore_transform = _make_restore_function("transform")
+_restore_vertex = _make_restore_function("vertex")
+_restore_wire = _make_restore_function("wire")
+
+_RESTORE_FUNCTIONS: dict[str, RestoreFunction] = {
+    "body": _restore_body,
+    "coedge": _restore_coedge,
+    "curve": _restore_curve,
+    "edge": _restore_edge,
+    "face": _restore_face,
+    "loop": _restore_loop,
+    "lump": _restore_lump,
+    "pattern": _restore_pattern,
+    "pcurve": _restore_pcurve,
+    "point": _restore_point,
+    "shell": _restore_shell,
+    "subshell": _restore_subshell,
+    "surface": _restore_surface,
+    "transform": _restore_transform,
+    "vertex": _restore_vertex,
+    "wire": _restore_wire,
+}
+
+
 def restore_entity(
     expected_type: str, loader: DataLoader, entity_factory: Factory
 ) -> Any:
-    raw_entity = loader.read_ptr()
-    if raw_entity.is_null_ptr:
-        return NONE_REF
-    if raw_entity.name.endswith(expected_type):
-        return entity_factory(raw_entity)
-    else:
-        raise const.ParsingError(
-            f"expected entity type '{expected_type}', got '{raw_entity.name}'"
-        )
+    try:
+        restore = _RESTORE_FUNCTIONS[expected_type]
+    except KeyError:
+        restore = _make_restore_function(expected_type)
+        _RESTORE_FUNCTIONS[expected_type] = restore
+    return restore(loader, entity_factory)
 
 
 @register
 class Transform(AcisEntity):
     type: str = "transform"
-    matrix = Matrix44()
+    __slots__ = ("matrix",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.matrix: Matrix44 = Matrix44()
 
     def restore_data(self, loader: DataLoader) -> None:
-        data = loader.read_transform()
-        # insert values of the 4th matrix column (0, 0, 0, 1)
-        data.insert(3, 0.0)
-        data.insert(7, 0.0)
-        data.insert(11, 0.0)
-        data.append(1.0)
-        self.matrix = Matrix44(data)
+        # fmt: off
+        (
+            m00, m01, m02,
+            m10, m11, m12,
+            m20, m21, m22,
+            m30, m31, m32,
+        ) = loader.read_transform()
+        # add values of the 4th matrix column (0, 0, 0, 1)
+        self.matrix = Matrix44((
+            m00, m01, m02, 0.0,
+            m10, m11, m12, 0.0,
+            m20, m21, m22, 0.0,
+            m30, m31, m32, 1.0,
+        ))
+        # fmt: on
 
     def write_common(self, exporter: DataExporter) -> None:
-        def write_double(value: float):
-            data.append(f"{value:g}")
-
-        data: list[str] = []
-        for row in self.matrix.rows():
-            write_double(row[0])
-            write_double(row[1])
-            write_double(row[2])
+        m = list(self.matrix)
+        # 4th column is not stored
+        data: list[str] = [
+            f"{value:g}" for value in (*m[0:3], *m[4:7], *m[8:11], *m[12:15])
+        ]
         test_vector = Vec3(1, 0, 0)
         result = self.matrix.transform_direction(test_vector)
         # A uniform scaling in x- y- and z-axis is assumed:
-        write_double(round(result.magnitude, 6))  # scale factor
+        data.append(f"{round(result.magnitude, 6):g}")  # scale factor
         is_rotated = not result.normalize().isclose(test_vector)
         data.append("rotate" if is_rotated else "no_rotate")
         data.append("no_reflect")
@@ -205,8 +282,10 @@ class Transform(AcisEntity):
 @register
 class AsmHeader(AcisEntity):
     type: str = "asmheader"
+    __slots__ = ("version",)
 
     def __init__(self, version: str = ""):
+        super().__init__()
         self.version = version
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
@@ -217,11 +296,15 @@ class AsmHeader(AcisEntity):
 
 
 class SupportsPattern(AcisEntity):
-    pattern: Pattern = NONE_REF
+    __slots__ = ("pattern",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pattern: Pattern = NONE_REF
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
-        if loader.version >= Features.PATTERN:
-            self.pattern = restore_entity("pattern", loader, entity_factory)
+        if loader.has_pattern:
+            self.pattern = _restore_pattern(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         exporter.write_ptr(self.pattern)
@@ -230,22 +313,23 @@ class SupportsPattern(AcisEntity):
 @register
 class Body(SupportsPattern):
     type: str = "body"
-    pattern: Pattern = NONE_REF
-    lump: Lump = NONE_REF
-    wire: Wire = NONE_REF
-    transform: Transform = NONE_REF
+    __slots__ = ("lump", "wire", "transform")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lump: Lump = NONE_REF
+        self.wire: Wire = NONE_REF
+        self.transform: Transform = NONE_REF
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.lump = restore_entity("lump", loader, entity_factory)
-        self.wire = restore_entity("wire", loader, entity_factory)
-        self.transform = restore_entity("transform", loader, entity_factory)
+        self.lump = _restore_lump(loader, entity_factory)
+        self.wire = _restore_wire(loader, entity_factory)
+        self.transform = _restore_transform(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
-        exporter.write_ptr(self.lump)
-        exporter.write_ptr(self.wire)
-        exporter.write_ptr(self.transform)
+        exporter.write_ptrs(self.lump, self.wire, self.transform)
 
     def append_lump(self, lump: Lump) -> None:
         """Append a :class:`Lump` entity as last lump."""
@@ -271,31 +355,35 @@ class Body(SupportsPattern):
 @register
 class Wire(SupportsPattern):  # not implemented
     type: str = "wire"
+    __slots__ = ()
 
 
 @register
 class Pattern(AcisEntity):  # not implemented
     type: str = "pattern"
+    __slots__ = ()
 
 
 @register
 class Lump(SupportsPattern):
     type: str = "lump"
-    next_lump: Lump = NONE_REF
-    shell: Shell = NONE_REF
-    body: Body = NONE_REF
+    __slots__ = ("next_lump", "shell", "body")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_lump: Lump = NONE_REF
+        self.shell: Shell = NONE_REF
+        self.body: Body = NONE_REF
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.next_lump = restore_entity("lump", loader, entity_factory)
-        self.shell = restore_entity("shell", loader, entity_factory)
-        self.body = restore_entity("body", loader, entity_factory)
+        self.next_lump = _restore_lump(loader, entity_factory)
+        self.shell = _restore_shell(loader, entity_factory)
+        self.body = _restore_body(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
-        exporter.write_ptr(self.next_lump)
-        exporter.write_ptr(self.shell)
-        exporter.write_ptr(self.body)
+        exporter.write_ptrs(self.next_lump, self.shell, self.body)
 
     def append_shell(self, shell: Shell) -> None:
         """Append a :class:`Shell` entity as last shell."""
@@ -321,27 +409,33 @@ class Lump(SupportsPattern):
 @register
 class Shell(SupportsPattern):
     type: str = "shell"
-    next_shell: Shell = NONE_REF
-    subshell: Subshell = NONE_REF
-    face: Face = NONE_REF
-    wire: Wire = NONE_REF
-    lump: Lump = NONE_REF
+    __slots__ = ("next_shell", "subshell", "face", "wire", "lump")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_shell: Shell = NONE_REF
+        self.subshell: Subshell = NONE_REF
+        self.face: Face = NONE_REF
+        self.wire: Wire = NONE_REF
+        self.lump: Lump = NONE_REF
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.next_shell = restore_entity("next_shell", loader, entity_factory)
-        self.subshell = restore_entity("subshell", loader, entity_factory)
-        self.face = restore_entity("face", loader, entity_factory)
-        self.wire = restore_entity("wire", loader, entity_factory)
-        self.lump = restore_entity("lump", loader, entity_factory)
+        self.next_shell = _restore_shell(loader, entity_factory)
+        self.subshell = _restore_subshell(loader, entity_factory)
+        self.face = _restore_face(loader, entity_factory)
+        self.wire = _restore_wire(loader, entity_factory)
+        self.lump = _restore_lump(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
-        exporter.write_ptr(self.next_shell)
-        exporter.write_ptr(self.subshell)
-        exporter.write_ptr(self.face)
-        exporter.write_ptr(self.wire)
-        exporter.write_ptr(self.lump)
+        exporter.write_ptrs(
+            self.next_shell,
+            self.subshell,
+            self.face,
+            self.wire,
+            self.lump,
+        )
 
     def append_face(self, face: Face) -> None:
         """Append a :class:`Face` entity as last face."""
@@ -367,40 +461,58 @@ class Shell(SupportsPattern):
 @register
 class Subshell(SupportsPattern):  # not implemented
     type: str = "subshell"
+    __slots__ = ()
 
 
 @register
 class Face(SupportsPattern):
     type: str = "face"
-    next_face: "Face" = NONE_REF
-    loop: Loop = NONE_REF
-    shell: Shell = NONE_REF
-    subshell: Subshell = NONE_REF
-    surface: Surface = NONE_REF
-    # sense: face normal with respect to the surface
-    sense = False  # True = reversed; False = forward
-    double_sided = False  # True = double (hollow body); False = single (solid body)
-    containment = False  # if double_sided: True = in, False = out
+    __slots__ = (
+        "next_face",
+        "loop",
+        "shell",
+        "subshell",
+        "surface",
+        "sense",
+        "double_sided",
+        "containment",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_face: "Face" = NONE_REF
+        self.loop: Loop = NONE_REF
+        self.shell: Shell = NONE_REF
+        self.subshell: Subshell = NONE_REF
+        self.surface: Surface = NONE_REF
+        # sense: face normal with respect to the surface
+        self.sense: bool = False  # True = reversed; False = forward
+        # double_sided: True = double (hollow body); False = single (solid body)
+        self.double_sided: bool = False
+        self.containment: bool = False  # if double_sided: True = in, False = out
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.next_face = restore_entity("face", loader, entity_factory)
-        self.loop = restore_entity("loop", loader, entity_factory)
-        self.shell = restore_entity("shell", loader, entity_factory)
-        self.subshell = restore_entity("subshell", loader, entity_factory)
-        self.surface = restore_entity("surface", loader, entity_factory)
-        self.sense = loader.read_bool("reversed", "forward")
-        self.double_sided = loader.read_bool("double", "single")
+        self.next_face = _restore_face(loader, entity_factory)
+        self.loop = _restore_loop(loader, entity_factory)
+        self.shell = _restore_shell(loader, entity_factory)
+        self.subshell = _restore_subshell(loader, entity_factory)
+        self.surface = _restore_surface(loader, entity_factory)
+        read_bool = loader.read_bool
+        self.sense = read_bool("reversed", "forward")
+        self.double_sided = read_bool("double", "single")
         if self.double_sided:
-            self.containment = loader.read_bool("in", "out")
+            self.containment = read_bool("in", "out")
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
-        exporter.write_ptr(self.next_face)
-        exporter.write_ptr(self.loop)
-        exporter.write_ptr(self.shell)
-        exporter.write_ptr(self.subshell)
-        exporter.write_ptr(self.surface)
+        exporter.write_ptrs(
+            self.next_face,
+            self.loop,
+            self.shell,
+            self.subshell,
+            self.surface,
+        )
         exporter.write_bool(self.sense, "reversed", "forward")
         exporter.write_bool(self.double_sided, "double", "single")
         if self.double_sided:
@@ -430,8 +542,12 @@ class Face(SupportsPattern):
 @register
 class Surface(SupportsPattern):
     type: str = "surface"
-    u_bounds = INF, INF
-    v_bounds = INF, INF
+    __slots__ = ("u_bounds", "v_bounds")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.u_bounds: tuple[float, float] = INF, INF
+        self.v_bounds: tuple[float, float] = INF, INF
 
     def restore_data(self, loader: DataLoader) -> None:
         self.u_bounds = loader.read_interval(), loader.read_interval()
@@ -455,20 +571,25 @@ class Surface(SupportsPattern):
 @register
 class Plane(Surface):
     type: str = "plane-surface"
-    origin = Vec3(0, 0, 0)
-    normal = Vec3(0, 0, 1)  # pointing outside
-    u_dir = Vec3(1, 0, 0)  # unit vector!
-    v_dir = Vec3(0, 1, 0)  # unit vector!
-    # reverse_v:
-    # True: "reverse_v" - the normal vector does not follow the right-hand rule
-    # False: "forward_v" - the normal vector follows right-hand rule
-    reverse_v = False
+    __slots__ = ("origin", "normal", "u_dir", "v_dir", "reverse_v")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.origin: Vec3 = Vec3(0, 0, 0)
+        self.normal: Vec3 = Vec3(0, 0, 1)  # pointing outside
+        self.u_dir: Vec3 = Vec3(1, 0, 0)  # unit vector!
+        self.v_dir: Vec3 = Vec3(0, 1, 0)  # unit vector!
+        # reverse_v:
+        # True: "reverse_v" - the normal vector does not follow the right-hand rule
+        # False: "forward_v" - the normal vector follows right-hand rule
+        self.reverse_v: bool = False
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.origin = Vec3(loader.read_vec3())
-        self.normal = Vec3(loader.read_vec3())
-        self.u_dir = Vec3(loader.read_vec3())
+        read_vec3 = loader.read_vec3
+        self.origin = read_vec3()
+        self.normal = read_vec3()
+        self.u_dir = read_vec3()
         self.reverse_v = loader.read_bool("reverse_v", "forward_v")
         self.update_v_dir()
 
@@ -493,21 +614,23 @@ class Plane(Surface):
 @register
 class Loop(SupportsPattern):
     type: str = "loop"
-    next_loop: Loop = NONE_REF
-    coedge: Coedge = NONE_REF
-    face: Face = NONE_REF  # parent/owner
+    __slots__ = ("next_loop", "coedge", "face")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_loop: Loop = NONE_REF
+        self.coedge: Coedge = NONE_REF
+        self.face: Face = NONE_REF  # parent/owner
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.next_loop = restore_entity("loop", loader, entity_factory)
-        self.coedge = restore_entity("coedge", loader, entity_factory)
-        self.face = restore_entity("face", loader, entity_factory)
+        self.next_loop = _restore_loop(loader, entity_factory)
+        self.coedge = _restore_coedge(loader, entity_factory)
+        self.face = _restore_face(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
-        exporter.write_ptr(self.next_loop)
-        exporter.write_ptr(self.coedge)
-        exporter.write_ptr(self.face)
+        exporter.write_ptrs(self.next_loop, self.coedge, self.face)
 
     def set_coedges(self, coedges: list[Coedge], close=True) -> None:
         """Set all coedges of a loop at once."""
@@ -543,38 +666,53 @@ class Loop(SupportsPattern):
 @register
 class Coedge(SupportsPattern):
     type: str = "coedge"
-    next_coedge: Coedge = NONE_REF
-    prev_coedge: Coedge = NONE_REF
-    # The partner_coedge points to the coedge of an adjacent face, in a
-    # manifold body each coedge has zero (open) or one (closed) partner edge.
-    # ACIS supports also non-manifold bodies, so there can be more than one
-    # partner coedges which are organized in a circular linked list.
-    partner_coedge: Coedge = NONE_REF
-    edge: Edge = NONE_REF
-    # sense: True = reversed; False = forward;
-    # coedge has the same direction as the underlying edge
-    sense: bool = True
-    loop: Loop = NONE_REF  # parent/owner
-    unknown: int = 0  # only in SAB file!?
-    pcurve: PCurve = NONE_REF
+    __slots__ = (
+        "next_coedge",
+        "prev_coedge",
+        "partner_coedge",
+        "edge",
+        "sense",
+        "loop",
+        "unknown",
+        "pcurve",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.next_coedge: Coedge = NONE_REF
+        self.prev_coedge: Coedge = NONE_REF
+        # The partner_coedge points to the coedge of an adjacent face, in a
+        # manifold body each coedge has zero (open) or one (closed) partner edge.
+        # ACIS supports also non-manifold bodies, so there can be more than one
+        # partner coedges which are organized in a circular linked list.
+        self.partner_coedge: Coedge = NONE_REF
+        self.edge: Edge = NONE_REF
+        # sense: True = reversed; False = forward;
+        # coedge has the same direction as the underlying edge
+        self.sense: bool = True
+        self.loop: Loop = NONE_REF  # parent/owner
+        self.unknown: int = 0  # only in SAB file!?
+        self.pcurve: PCurve = NONE_REF
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.next_coedge = restore_entity("coedge", loader, entity_factory)
-        self.prev_coedge = restore_entity("coedge", loader, entity_factory)
-        self.partner_coedge = restore_entity("coedge", loader, entity_factory)
-        self.edge = restore_entity("edge", loader, entity_factory)
+        self.next_coedge = _restore_coedge(loader, entity_factory)
+        self.prev_coedge = _restore_coedge(loader, entity_factory)
+        self.partner_coedge = _restore_coedge(loader, entity_factory)
+        self.edge = _restore_edge(loader, entity_factory)
         self.sense = loader.read_bool("reversed", "forward")
-        self.loop = restore_entity("loop", loader, entity_factory)
+        self.loop = _restore_loop(loader, entity_factory)
         self.unknown = loader.read_int(skip_sat=0)
-        self.pcurve = restore_entity("pcurve", loader, entity_factory)
+        self.pcurve = _restore_pcurve(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
-        exporter.write_ptr(self.next_coedge)
-        exporter.write_ptr(self.prev_coedge)
-        exporter.write_ptr(self.partner_coedge)
-        exporter.write_ptr(self.edge)
+        exporter.write_ptrs(
+            self.next_coedge,
+            self.prev_coedge,
+            self.partner_coedge,
+            self.edge,
+        )
         exporter.write_bool(self.sense, "reversed", "forward")
         exporter.write_ptr(self.loop)
         # TODO: write_int() ?
@@ -613,33 +751,46 @@ class Coedge(SupportsPattern):
 @register
 class Edge(SupportsPattern):
     type: str = "edge"
-
-    # The parent edge of the start_vertex doesn't have to be this edge!
-    start_vertex: Vertex = NONE_REF
-    start_param: float = 0.0
-
-    # The parent edge of the end_vertex doesn't have to be this edge!
-    end_vertex: Vertex = NONE_REF
-    end_param: float = 0.0
-    coedge: Coedge = NONE_REF
-    curve: Curve = NONE_REF
-    # sense: True = reversed; False = forward;
-    # forward: edge has the same direction as the underlying curve
-    sense: bool = False
-    convexity: str = "unknown"
+    __slots__ = (
+        "start_vertex",
+        "start_param",
+        "end_vertex",
+        "end_param",
+        "coedge",
+        "curve",
+        "sense",
+        "convexity",
+    )
+
+    def __init__(self) -> None:
+        super().__init__()
+        # The parent edge of the start_vertex doesn't have to be this edge!
+        self.start_vertex: Vertex = NONE_REF
+        self.start_param: float = 0.0
+        # The parent edge of the end_vertex doesn't have to be this edge!
+        self.end_vertex: Vertex = NONE_REF
+        self.end_param: float = 0.0
+        self.coedge: Coedge = NONE_REF
+        self.curve: Curve = NONE_REF
+        # sense: True = reversed; False = forward;
+        # forward: edge has the same direction as the underlying curve
+        self.sense: bool = False
+        self.convexity: str = "unknown"
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.start_vertex = restore_entity("vertex", loader, entity_factory)
-        if loader.version >= Features.TOL_MODELING:
-            self.start_param = loader.read_double()
-        self.end_vertex = restore_entity("vertex", loader, entity_factory)
-        if loader.version >= Features.TOL_MODELING:
-            self.end_param = loader.read_double()
-        self.coedge = restore_entity("coedge", loader, entity_factory)
-        self.curve = restore_entity("curve", loader, entity_factory)
+        tol_modeling = loader.has_tol_modeling
+        read_double = loader.read_double
+        self.start_vertex = _restore_vertex(loader, entity_factory)
+        if tol_modeling:
+            self.start_param = read_double()
+        self.end_vertex = _restore_vertex(loader, entity_factory)
+        if tol_modeling:
+            self.end_param = read_double()
+        self.coedge = _restore_coedge(loader, entity_factory)
+        self.curve = _restore_curve(loader, entity_factory)
         self.sense = loader.read_bool("reversed", "forward")
-        if loader.version >= Features.TOL_MODELING:
+        if tol_modeling:
             self.convexity = loader.read_str()
 
     def write_common(self, exporter: DataExporter) -> None:
@@ -649,8 +800,7 @@ class Edge(SupportsPattern):
         exporter.write_double(self.start_param)
         exporter.write_ptr(self.end_vertex)
         exporter.write_double(self.end_param)
-        exporter.write_ptr(self.coedge)
-        exporter.write_ptr(self.curve)
+        exporter.write_ptrs(self.coedge, self.curve)
         exporter.write_bool(self.sense, "reversed", "forward")
         exporter.write_str(self.convexity)
 
@@ -658,20 +808,25 @@ class Edge(SupportsPattern):
 @register
 class PCurve(SupportsPattern):  # not implemented
     type: str = "pcurve"
+    __slots__ = ()
 
 
 @register
 class Vertex(SupportsPattern):
     type: str = "vertex"
-    edge: Edge = NONE_REF
-    ref_count: int = 0  # only in SAB files
-    point: Point = NONE_REF
+    __slots__ = ("edge", "ref_count", "point")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.edge: Edge = NONE_REF
+        self.ref_count: int = 0  # only in SAB files
+        self.point: Point = NONE_REF
 
     def restore_common(self, loader: DataLoader, entity_factory: Factory) -> None:
         super().restore_common(loader, entity_factory)
-        self.edge = restore_entity("edge", loader, entity_factory)
+        self.edge = _restore_edge(loader, entity_factory)
         self.ref_count = loader.read_int(skip_sat=0)
-        self.point = restore_entity("point", loader, entity_factory)
+        self.point = _restore_point(loader, entity_factory)
 
     def write_common(self, exporter: DataExporter) -> None:
         super().write_common(exporter)
@@ -683,7 +838,11 @@ class Vertex(SupportsPattern):
 @register
 class Curve(SupportsPattern):
     type: str = "curve"
-    bounds = INF, INF
+    __slots__ = ("bounds",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bounds: tuple[float, float] = INF, INF
 
     def restore_data(self, loader: DataLoader) -> None:
         self.bounds = loader.read_interval(), loader.read_interval()
@@ -704,12 +863,16 @@ class Curve(SupportsPattern):
 @register
 class StraightCurve(Curve):
     type: str = "straight-curve"
-    origin = Vec3(0, 0, 0)
-    direction = Vec3(1, 0, 0)
+    __slots__ = ("origin", "direction")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.origin: Vec3 = Vec3(0, 0, 0)
+        self.direction: Vec3 = Vec3(1, 0, 0)
 
     def restore_data(self, loader: DataLoader) -> None:
-        self.origin = Vec3(loader.read_vec3())
-        self.direction = Vec3(loader.read_vec3())
+        self.origin = loader.read_vec3()
+        self.direction = loader.read_vec3()
         super().restore_data(loader)
 
     def write_data(self, exporter: DataExporter) -> None:
@@ -724,10 +887,14 @@ class StraightCurve(Curve):
 @register
 class Point(SupportsPattern):
     type: str = "point"
-    location: Vec3 = NULLVEC
+    __slots__ = ("location",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.location: Vec3 = NULLVEC
 
     def restore_data(self, loader: DataLoader) -> None:
-        self.location = Vec3(loader.read_vec3())
+        self.location = loader.read_vec3()
 
     def write_data(self, exporter: DataExporter) -> None:
         exporter.write_loc_vec3(self.location)
@@ -735,6 +902,7 @@ class Point(SupportsPattern):
 
 class FileLoader(abc.ABC):
     records: Sequence[sat.SatEntity | sab.SabEntity]
+    raw_bodies: Sequence[sat.SatEntity | sab.SabEntity]
 
     def __init__(self, version: int):
         self.entities: dict[int, AcisEntity] = {}
@@ -742,27 +910,38 @@ class FileLoader(abc.ABC):
 
     def entity_factory(self, raw_entity: AbstractEntity) -> AcisEntity:
         uid = id(raw_entity)
-        try:
-            return self.entities[uid]
-        except KeyError:  # create a new entity
-            entity = ENTITY_TYPES.get(raw_entity.name, AcisEntity)()
+        entity = self.entities.get(uid)
+        if entity is None:  # create a new entity
+            # Each entity is created once, so a KeyError exception would be
+            # raised for each entity by a try-except block.
+            entity = _get_entity_type(raw_entity.name, AcisEntity)()
             self.entities[uid] = entity
-            return entity
+        return entity
 
     def bodies(self) -> list[Body]:
+        # The builder collects the raw body entities while parsing, so there
+        # is no need to scan all loaded entities:
+        entities = self.entities
+        bodies = (entities.get(id(raw_body)) for raw_body in self.raw_bodies)
         # noinspection PyTypeChecker
-        return [e for e in self.entities.values() if isinstance(e, Body)]
+        return [body for body in bodies if isinstance(body, Body)]
 
     def load_entities(self):
         entity_factory = self.entity_factory
-
-        for raw_entity in self.records:
-            entity = entity_factory(raw_entity)
+        records = self.records
+        # Create all entities in record order in advance, the entity factory
+        # just returns the existing entities for the pointers in the records:
+        entities = [_get_entity_type(r.name, AcisEntity)() for r in records]
+        self.entities.update(zip(map(id, records), entities))
+        # reuse a single data loader for all records
+        data_loader = self.make_data_loader([])
+
+        for raw_entity, entity in zip(records, entities):
             entity.id = raw_entity.id
             attributes = raw_entity.attributes
             if not attributes.is_null_ptr:
                 entity.attributes = entity_factory(attributes)
-            data_loader = self.make_data_loader(raw_entity.data)
+            data_loader.reset(raw_entity.data)
             entity.load(data_loader, entity_factory)
 
     @abc.abstractmethod
@@ -775,6 +954,7 @@ class SabLoader(FileLoader):
         builder = sab.parse_sab(data)
         super().__init__(builder.header.version)
         self.records = builder.entities
+        self.raw_bodies = builder.bodies
 
     def make_data_loader(self, data: list[Any]) -> DataLoader:
         return sab.SabDataLoader(data, self.version)
@@ -791,6 +971,7 @@ class SatLoader(FileLoader):
         builder = sat.parse_sat(data)
         super().__init__(builder.header.version)
         self.records = builder.entities
+        self.raw_bodies = builder.bodies
 
     def make_data_loader(self, data: list[Any]) -> DataLoader:
         return sat.SatDataLoader(data, self.version)
@@ -800,3 +981,13 @@ class SatLoader(FileLoader):
         loader = cls(data)
         loader.load_entities()
         return loader.bodies()
+
+
+# loader dispatch table by exact data type
+_LOADERS: dict[type, Type[SabLoader] | Type[SatLoader]] = {
+    bytes: SabLoader,
+    bytearray: SabLoader,
+    str: SatLoader,
+    list: SatLoader,
+    tuple: SatLoader,
+}
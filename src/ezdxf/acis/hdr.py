@@ -18,6 +18,59 @@ from . import const
 # test script: exploration/acis/transplant_acis_data.py
 
 
+_WEEKDAYS = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def parse_ctime(s: str) -> datetime:
+    """Returns the :class:`datetime` of a date string in the format of
+    :meth:`datetime.ctime`: "Sat Jan  1 10:00:00 2022".
+
+    Raises:
+        ValueError: invalid date string
+
+    """
+    # fast path for the fixed format created by datetime.ctime(), any deviation
+    # falls back to strptime(), which raises ValueError for invalid strings
+    if (
+        len(s) == 24
+        and s[3] == s[7] == s[10] == s[19] == " "
+        and s[13] == s[16] == ":"
+        and s[0:3] in _WEEKDAYS
+        and (s[8] == " " or s[8].isdigit())
+        and s[9].isdigit()
+        and s[11:13].isdigit()
+        and s[14:16].isdigit()
+        and s[17:19].isdigit()
+        and s[20:24].isdigit()
+    ):
+        try:
+            return datetime(
+                int(s[20:24]),  # year
+                _MONTHS[s[4:7]],  # month
+                int(s[8:10]),  # day
+                int(s[11:13]),  # hour
+                int(s[14:16]),  # minute
+                int(s[17:19]),  # second
+            )
+        except (KeyError, ValueError):
+            pass
+    return datetime.strptime(s, const.DATE_FMT)
+
+
 def encode_str(s: str) -> bytes:
     b = s.encode("utf8", errors="ignore")
     return struct.pack("<BB", const.Tags.STR, len(b)) + b
@@ -41,6 +94,10 @@ class AcisHeader:
     units_in_mm: float = 1.0
     asm_version: str = ""
     asm_end_marker: bool = False  # depends on DXF version: R2013, RT2018
+    # cache for the SAT header string: (key, header string)
+    _header_str_cache: tuple[tuple, str] = field(
+        default=((), ""), init=False, repr=False, compare=False
+    )
 
     @property
     def has_asm_header(self) -> bool:
@@ -74,13 +131,26 @@ class AcisHeader:
         return b"".join(buffer)
 
     def _header_str(self) -> str:
-        p_len = len(self.product_id)
-        a_len = len(self.acis_version)
+        has_at_prefix = self.version > 400
+        key = (has_at_prefix, self.product_id, self.acis_version, self.creation_date)
+        cached_key, header_str = self._header_str_cache
+        if cached_key == key:
+            return header_str
+        prefix = "@" if has_at_prefix else ""
         date = self.creation_date.ctime()
-        if self.version > 400:
-            return f"@{p_len} {self.product_id} @{a_len} {self.acis_version} @{len(date)} {date} "
-        else:
-            return f"{p_len} {self.product_id} {a_len} {self.acis_version} {len(date)} {date} "
+        header_str = " ".join(
+            (
+                f"{prefix}{len(self.product_id)}",
+                self.product_id,
+                f"{prefix}{len(self.acis_version)}",
+                self.acis_version,
+                f"{prefix}{len(date)}",
+                date,
+                "",  # trailing space
+            )
+        )
+        self._header_str_cache = key, header_str
+        return header_str
 
     def set_version(self, version: int) -> None:
         """Sets the ACIS version as an integer value and updates the version
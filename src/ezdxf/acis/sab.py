@@ -11,18 +11,16 @@ from typing import (
     cast,
     TYPE_CHECKING,
     List,
-    Tuple,
     Optional,
 )
 from typing_extensions import TypeAlias
 import math
 import struct
-from datetime import datetime
 
 from ezdxf.math import Vec3
 from . import const
 from .const import ParsingError, Tags, InvalidLinkStructure
-from .hdr import AcisHeader
+from .hdr import AcisHeader, parse_ctime
 from .abstract import (
     AbstractEntity,
     DataLoader,
@@ -72,7 +70,7 @@ class Decoder:
         header.product_id = self.read_str_tag()
         header.acis_version = self.read_str_tag()
         date = self.read_str_tag()
-        header.creation_date = datetime.strptime(date, const.DATE_FMT)
+        header.creation_date = parse_ctime(date)
         header.units_in_mm = self.read_double_tag()
         # tolerances are ignored
         _ = self.read_double_tag()  # res_tol
@@ -157,9 +155,9 @@ class Decoder:
                 values.append(Token(tag, entity_name()))
                 entity_type.clear()
             elif tag == Tags.LOCATION_VEC:
-                values.append(Token(tag, self.read_floats(3)))
+                values.append(Token(tag, Vec3(self.read_floats(3))))
             elif tag == Tags.DIRECTION_VEC:
-                values.append(Token(tag, self.read_floats(3)))
+                values.append(Token(tag, Vec3(self.read_floats(3))))
             elif tag == Tags.ENUM:
                 values.append(Token(tag, self.read_int()))
             elif tag == Tags.UNKNOWN_0x17:
@@ -191,6 +189,8 @@ class Decoder:
 class SabEntity(AbstractEntity):
     """Low level representation of an ACIS entity (node)."""
 
+    __slots__ = ("name", "attr_ptr", "id", "data", "attributes")
+
     def __init__(
         self,
         name: str,
@@ -214,6 +214,8 @@ NULL_PTR = SabEntity(const.NULL_PTR_NAME, -1, -1, tuple())  # type: ignore
 class SabDataLoader(DataLoader):
     def __init__(self, data: SabRecord, version: int):
         self.version = version
+        self.has_pattern = version >= const.Features.PATTERN
+        self.has_tol_modeling = version >= const.Features.TOL_MODELING
         self.data = data
         self.index = 0
 
@@ -240,11 +242,11 @@ class SabDataLoader(DataLoader):
             return self.read_double()
         return math.inf
 
-    def read_vec3(self) -> tuple[float, float, float]:
+    def read_vec3(self) -> Vec3:
         token = self.data[self.index]
         if token.tag in (Tags.LOCATION_VEC, Tags.DIRECTION_VEC):
             self.index += 1
-            return cast(Tuple[float, float, float], token.value)
+            return cast(Vec3, token.value)
         raise ParsingError(f"expected vector token, got {token}")
 
     def read_bool(self, true: str, false: str) -> bool:
@@ -277,8 +279,8 @@ class SabDataLoader(DataLoader):
         # Read only the matrix values which contain all information needed,
         # the additional data are only hints for the kernel how to process
         # the data (rotation, reflection, scaling, shearing).
-        values = self.read_str().split(" ")
-        return [float(v) for v in values[:12]]
+        values = self.read_str().split(" ", 12)
+        return list(map(float, values[:12]))
 
 
 class SabBuilder(AbstractBuilder):
@@ -288,6 +290,7 @@ class SabBuilder(AbstractBuilder):
         self.header = AcisHeader()
         self.bodies: list[SabEntity] = []
         self.entities: list[SabEntity] = []
+        self._entities_by_name: dict[str, list[SabEntity]] = {}
 
     def dump_sab(self) -> bytes:
         """Returns the SAB representation of the ACIS file as bytes."""
@@ -305,11 +308,6 @@ class SabBuilder(AbstractBuilder):
         data.append(self.header.sab_end_marker())
         return b"".join(data)
 
-    def set_entities(self, entities: list[SabEntity]) -> None:
-        """Reset entities and bodies list. (internal API)"""
-        self.bodies = [e for e in entities if e.name == "body"]
-        self.entities = entities
-
 
 class SabExporter(EntityExporter[SabEntity]):
     def make_record(self, entity: AcisEntity) -> SabEntity:
@@ -429,11 +427,21 @@ class SabDataExporter(DataExporter):
             record = self.exporter.get_record(entity)
         self.data.append(Token(Tags.POINTER, record))
 
+    def write_ptrs(self, *entities: AcisEntity) -> None:
+        get_record = self.exporter.get_record
+        self.data.extend(
+            Token(Tags.POINTER, NULL_PTR if entity.is_none else get_record(entity))
+            for entity in entities
+        )
+
     def write_transform(self, data: list[str]) -> None:
         # The last space is important!
         self.write_literal_str(" ".join(data) + " ")
 
 
+NULL_PTR_TOKEN = Token(Tags.POINTER, -1)
+
+
 def encode_entity_type(name: str) -> list[Token]:
     if name == const.NULL_PTR_NAME:
         raise InvalidLinkStructure(
@@ -445,28 +453,30 @@ def encode_entity_type(name: str) -> list[Token]:
     return tokens
 
 
-def encode_entity_ptr(entity: SabEntity, entities: list[SabEntity]) -> Token:
-    if entity.is_null_ptr:
-        return Token(Tags.POINTER, -1)
-    try:
-        return Token(Tags.POINTER, entities.index(entity))
-    except ValueError:
-        raise InvalidLinkStructure(
-            f"entity {str(entity)} not in record storage"
-        )
-
-
 def build_sab_records(entities: list[SabEntity]) -> Iterator[SabRecord]:
+    def encode_entity_ptr(e: SabEntity) -> Token:
+        if e.is_null_ptr:
+            return NULL_PTR_TOKEN
+        try:
+            return ptr_tokens[id(e)]
+        except KeyError:
+            raise InvalidLinkStructure(f"entity {str(e)} not in record storage")
+
+    # Map object id to the pointer token of the record index, avoids O(n)
+    # list.index() lookups and creates each pointer token only once:
+    ptr_tokens: dict[int, Token] = {
+        id(e): Token(Tags.POINTER, i) for i, e in enumerate(entities)
+    }
     for entity in entities:
         record: list[Token] = []
         record.extend(encode_entity_type(entity.name))
         # 1. attribute record pointer
-        record.append(encode_entity_ptr(entity.attributes, entities))
+        record.append(encode_entity_ptr(entity.attributes))
         # 2. int id
         record.append(Token(Tags.INT, entity.id))
         for token in entity.data:
             if token.tag == Tags.POINTER:
-                record.append(encode_entity_ptr(token.value, entities))
+                record.append(encode_entity_ptr(token.value))
             elif token.tag == Tags.ENTITY_TYPE:
                 record.extend(encode_entity_type(token.value))
             else:
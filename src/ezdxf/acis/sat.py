@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import (
     Any,
     Sequence,
+    Iterable,
     Iterator,
     Union,
     List,
@@ -12,11 +13,11 @@ from typing import (
 )
 from typing_extensions import TypeAlias
 import math
-from datetime import datetime
+import re
 
 from . import const
 from .const import ParsingError, InvalidLinkStructure
-from .hdr import AcisHeader
+from .hdr import AcisHeader, parse_ctime
 from .abstract import (
     AbstractEntity,
     AbstractBuilder,
@@ -25,9 +26,10 @@ from .abstract import (
     EntityExporter,
 )
 
+from ezdxf.math import Vec3
+
 if TYPE_CHECKING:
     from .entities import AcisEntity
-    from ezdxf.math import Vec3
 
 SatRecord: TypeAlias = List[str]
 
@@ -35,6 +37,8 @@ SatRecord: TypeAlias = List[str]
 class SatEntity(AbstractEntity):
     """Low level representation of an ACIS entity (node)."""
 
+    __slots__ = ("name", "attr_ptr", "id", "data", "attributes")
+
     def __init__(
         self,
         name: str,
@@ -77,11 +81,13 @@ def new_entity(
 
 def is_ptr(s: str) -> bool:
     """Returns ``True`` if the string `s` represents an entity pointer."""
-    return len(s) > 0 and s[0] == "$"
+    return s.startswith("$")
 
 
 def resolve_str_pointers(entities: list[SatEntity]) -> list[SatEntity]:
     def ptr(s: str) -> SatEntity:
+        if s == "$-1":  # most common pointer, no int conversion required
+            return NULL_PTR
         num = int(s[1:])
         if num == -1:
             return NULL_PTR
@@ -90,19 +96,18 @@ def resolve_str_pointers(entities: list[SatEntity]) -> list[SatEntity]:
     for entity in entities:
         entity.attributes = ptr(entity.attr_ptr)
         entity.attr_ptr = "$-1"
-        data = []
-        for token in entity.data:
-            if is_ptr(token):
-                data.append(ptr(token))
-            else:
-                data.append(token)
-        entity.data = data
+        # inlined is_ptr() check, this is the hot loop of the SAT parser
+        entity.data = [
+            ptr(token) if token[:1] == "$" else token for token in entity.data
+        ]
     return entities
 
 
 class SatDataLoader(DataLoader):
     def __init__(self, data: list[Any], version: int):
         self.version = version
+        self.has_pattern = version >= const.Features.PATTERN
+        self.has_tol_modeling = version >= const.Features.TOL_MODELING
         self.data = data
         self.index = 0
 
@@ -136,11 +141,23 @@ class SatDataLoader(DataLoader):
             return self.read_double()
         return math.inf
 
-    def read_vec3(self) -> tuple[float, float, float]:
-        x = self.read_double()
-        y = self.read_double()
-        z = self.read_double()
-        return x, y, z
+    def read_doubles(self, count: int) -> list[float]:
+        """Read `count` doubles at once."""
+        start = self.index
+        entries = self.data[start : start + count]
+        if len(entries) == count:
+            try:
+                values = list(map(float, entries))
+            except ValueError:
+                pass
+            else:
+                self.index += count
+                return values
+        # Read values one by one to raise the same exception as read_double():
+        return [self.read_double() for _ in range(count)]
+
+    def read_vec3(self) -> Vec3:
+        return Vec3(self.read_doubles(3))
 
     def read_bool(self, true: str, false: str) -> bool:
         value = self.data[self.index]
@@ -173,7 +190,7 @@ class SatDataLoader(DataLoader):
         # Read only the matrix values which contain all information needed,
         # the additional data are only hints for the kernel how to process
         # the data (rotation, reflection, scaling, shearing).
-        return [self.read_double() for _ in range(12)]
+        return self.read_doubles(12)
 
 
 class SatBuilder(AbstractBuilder):
@@ -183,6 +200,7 @@ class SatBuilder(AbstractBuilder):
         self.header = AcisHeader()
         self.bodies: list[SatEntity] = []
         self.entities: list[SatEntity] = []
+        self._entities_by_name: dict[str, list[SatEntity]] = {}
         self._export_mapping: dict[int, SatEntity] = {}
 
     def dump_sat(self) -> list[str]:
@@ -207,11 +225,6 @@ class SatBuilder(AbstractBuilder):
         data.append(self.header.sat_end_marker())
         return data
 
-    def set_entities(self, entities: list[SatEntity]) -> None:
-        """Reset entities and bodies list. (internal API)"""
-        self.bodies = [e for e in entities if e.name == "body"]
-        self.entities = entities
-
 
 class SatExporter(EntityExporter[SatEntity]):
     def make_record(self, entity: AcisEntity) -> SatEntity:
@@ -231,45 +244,52 @@ class SatExporter(EntityExporter[SatEntity]):
 
 def build_str_records(entities: list[SatEntity], version: int) -> Iterator[str]:
     def ptr_str(e: SatEntity) -> str:
-        if e is NULL_PTR:
-            return "$-1"
         try:
-            return f"${entities.index(e)}"
-        except ValueError:
+            return ptr_strings[id(e)]
+        except KeyError:
             raise InvalidLinkStructure(f"entity {str(e)} not in record storage")
 
-    for entity in entities:
-        tokens = [entity.name]
-        tokens.append(ptr_str(entity.attributes))
-        if version >= 700:
-            tokens.append(str(entity.id))
+    # Map object id to the pointer string of the record index, avoids O(n)
+    # list.index() lookups and creates each pointer string only once:
+    ptr_strings: dict[int, str] = {id(e): f"${i}" for i, e in enumerate(entities)}
+    ptr_strings[id(NULL_PTR)] = "$-1"
+
+    # The version check is done once and not for each entity:
+    record_heads: Iterator[list[str]]
+    if version >= 700:
+        record_heads = (
+            [e.name, ptr_str(e.attributes), f"{e.id}"] for e in entities
+        )
+    else:
+        record_heads = ([e.name, ptr_str(e.attributes)] for e in entities)
+
+    for entity, tokens in zip(entities, record_heads):
+        append = tokens.append
         for data in entity.data:
             if isinstance(data, SatEntity):
-                tokens.append(ptr_str(data))
+                append(ptr_str(data))
             else:
-                tokens.append(str(data))
-        tokens.append("#")
+                append(f"{data}")
+        append("#")
         yield " ".join(tokens)
 
 
+# length prefixed string: "@5 ACIS " or "5 ACIS "
+_HEADER_STR_PREFIX = re.compile(r"\s*@?(\d+) ")
+
+
 def parse_header_str(s: str) -> Iterator[str]:
-    num = ""
-    collect = 0
-    token = ""
-    for c in s.rstrip():
-        if collect > 0:
-            token += c
-            collect -= 1
-            if collect == 0:
-                yield token
-                token = ""
-        elif c == "@":
-            continue
-        elif c in "0123456789":
-            num += c
-        elif c == " " and num:
-            collect = int(num)
-            num = ""
+    s = s.rstrip()
+    pos = 0
+    while True:
+        match = _HEADER_STR_PREFIX.match(s, pos)
+        if match is None:
+            return
+        start = match.end()
+        pos = start + int(match.group(1))
+        if pos > len(s):
+            return
+        yield s[start:pos]
 
 
 def parse_header(data: Sequence[str]) -> tuple[AcisHeader, Sequence[str]]:
@@ -291,7 +311,7 @@ def parse_header(data: Sequence[str]) -> tuple[AcisHeader, Sequence[str]]:
 
     if len(tokens) > 2:
         try:  # Sat Jan  1 10:00:00 2022
-            header.creation_date = datetime.strptime(tokens[2], const.DATE_FMT)
+            header.creation_date = parse_ctime(tokens[2])
         except ValueError:
             pass
     tokens = data[2].split()
@@ -311,34 +331,55 @@ def _filter_records(data: Sequence[str]) -> Iterator[str]:
         yield line
 
 
+def _tokenize_records(data: Sequence[str]) -> Iterator[SatRecord]:
+    # Tokenizes the SAT data line by line in a single pass, this avoids merging
+    # the parts of multi-line records into strings.
+    tokens: SatRecord = []
+    for line in _filter_records(data):
+        if "#" not in line:
+            tokens.extend(line.split())
+            continue
+        chunks = line.split("#")
+        tokens.extend(chunks[0].split())
+        if tokens:
+            yield tokens
+        for chunk in chunks[1:-1]:
+            tokens = chunk.split()
+            if tokens:
+                yield tokens
+        tokens = chunks[-1].split()
+    if tokens:
+        yield tokens
+
+
 def merge_record_strings(data: Sequence[str]) -> Iterator[str]:
-    merged_data = " ".join(_filter_records(data))
-    for record in merged_data.split("#"):
-        record = record.strip()
-        if record:
-            yield record
+    # The tokens are separated by a single space, the parser works on the tokens
+    # of _tokenize_records() and does not use this function.
+    for tokens in _tokenize_records(data):
+        yield " ".join(tokens)
 
 
-def parse_records(data: Sequence[str]) -> list[SatRecord]:
+def iter_records(data: Sequence[str]) -> Iterator[SatRecord]:
     expected_seq_num = 0
-    records: list[SatRecord] = []
-    for line in merge_record_strings(data):
-        tokens: SatRecord = line.split()
-        first_token = tokens[0].strip()
-        if first_token.startswith("-"):
+    for tokens in _tokenize_records(data):
+        first_token = tokens[0]
+        if first_token[:1] == "-":
             num = -int(first_token)
             if num != expected_seq_num:
                 raise ParsingError(
                     "non-continuous sequence numbers not supported"
                 )
             tokens.pop(0)
-        records.append(tokens)
+        yield tokens
         expected_seq_num += 1
-    return records
+
+
+def parse_records(data: Sequence[str]) -> list[SatRecord]:
+    return list(iter_records(data))
 
 
 def build_entities(
-    records: Sequence[SatRecord], version: int
+    records: Iterable[SatRecord], version: int
 ) -> list[SatEntity]:
     entities: list[SatEntity] = []
     for record in records:
@@ -372,8 +413,9 @@ def parse_sat(s: Union[str, Sequence[str]]) -> SatBuilder:
     builder = SatBuilder()
     header, data = parse_header(data)
     builder.header = header
-    records = parse_records(data)
-    entities = build_entities(records, header.version)
+    # records are consumed one by one, the entities list is the only
+    # container of the whole SAT data
+    entities = build_entities(iter_records(data), header.version)
     builder.set_entities(resolve_str_pointers(entities))
     return builder
 
@@ -427,5 +469,11 @@ class SatDataExporter(DataExporter):
             record = self.exporter.get_record(entity)
         self.data.append(record)
 
+    def write_ptrs(self, *entities: AcisEntity) -> None:
+        get_record = self.exporter.get_record
+        self.data.extend(
+            NULL_PTR if entity.is_none else get_record(entity) for entity in entities
+        )
+
     def write_transform(self, data: list[str]) -> None:
         self.data.extend(data)
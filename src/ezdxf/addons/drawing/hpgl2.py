@@ -54,7 +54,7 @@ class PlotterBackend(recorder.Recorder):
         self,
         page: layout.Page,
         *,
-        settings: layout.Settings = layout.Settings(),
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
         render_box: BoundingBox2d | None = None,
         curves=True,
         decimal_places: int = 1,
@@ -112,7 +112,9 @@ class PlotterBackend(recorder.Recorder):
         return backend.get_bytes()
 
     def compatible(
-        self, page: layout.Page, settings: layout.Settings = layout.Settings()
+        self,
+        page: layout.Page,
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
     ) -> bytes:
         """Returns the HPGL/2 data as 7-bit encoded bytes curves as approximated
         polylines and coordinates are rounded to integer values.
@@ -124,7 +126,9 @@ class PlotterBackend(recorder.Recorder):
         )
 
     def low_quality(
-        self, page: layout.Page, settings: layout.Settings = layout.Settings()
+        self,
+        page: layout.Page,
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
     ) -> bytes:
         """Returns the HPGL/2 data as 8-bit encoded bytes, curves as Bézier
         curves and coordinates are rounded to integer values.
@@ -136,7 +140,9 @@ class PlotterBackend(recorder.Recorder):
         )
 
     def normal_quality(
-        self, page: layout.Page, settings: layout.Settings = layout.Settings()
+        self,
+        page: layout.Page,
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
     ) -> bytes:
         """Returns the HPGL/2 data as 8-bit encoded bytes, curves as Bézier
         curves and coordinates are floats rounded to one decimal place.
@@ -148,7 +154,9 @@ class PlotterBackend(recorder.Recorder):
         )
 
     def high_quality(
-        self, page: layout.Page, settings: layout.Settings = layout.Settings()
+        self,
+        page: layout.Page,
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
     ) -> bytes:
         """Returns the HPGL/2 data as 8-bit encoded bytes and all curves as Bézier
         curves and coordinates are floats rounded to two decimal places.
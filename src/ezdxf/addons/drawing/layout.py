@@ -181,6 +181,8 @@ class Page:
     @property
     def margins_in_mm(self) -> Margins:
         """Returns the page margins in mm."""
+        if self.units == Units.mm:
+            return self.margins  # immutable NamedTuple
         return self.margins.scale(self.to_mm_factor)
 
     @property
@@ -341,6 +343,10 @@ class Settings:
             return 1.0
 
 
+# default argument of the backends, which copy the settings before modifying them
+DEFAULT_SETTINGS = Settings()
+
+
 class Layout:
     def __init__(self, render_box: BoundingBox2d, flip_y=False) -> None:
         super().__init__()
@@ -371,7 +377,7 @@ class Layout:
         return final_page_size(content_size, page, settings)
 
     def get_placement_matrix(
-        self, page: Page, settings=Settings(), top_origin=True
+        self, page: Page, settings: Settings = DEFAULT_SETTINGS, top_origin=True
     ) -> Matrix44:
         # Argument `page` has to be the resolved final page size!
         rotation = self.get_rotation(settings)
@@ -387,6 +393,8 @@ class Layout:
         # map output coordinates to range [0, output_coordinate_space]
         scale_mm_to_output_space = settings.page_output_scale_factor(page)
         scale = scale_dxf_to_mm * scale_mm_to_output_space
+        if abs(scale) < 1e-9:
+            scale = 1.0
         m = placement_matrix(
             self.render_box,
             sx=scale,
@@ -455,41 +463,45 @@ def placement_matrix(
     top_origin=True,
 ) -> Matrix44:
     """Returns a matrix to place the bbox in the first quadrant of the coordinate
-    system (+x, +y).
+    system (+x, +y). The scaling factors `sx` and `sy` must not be zero.
     """
+    page_width = page.width_in_mm
+    page_height = page.height_in_mm
     try:
-        scale_mm_to_vb = output_coordinate_space / max(
-            page.width_in_mm, page.height_in_mm
-        )
+        scale_mm_to_vb = output_coordinate_space / max(page_width, page_height)
     except ZeroDivisionError:
         scale_mm_to_vb = 1.0
     margins = page.margins_in_mm
 
     # create scaling and rotation matrix:
-    if abs(sx) < 1e-9:
-        sx = 1.0
-    if abs(sy) < 1e-9:
-        sy = 1.0
-    m = Matrix44.scale(sx, sy, 1.0)
+    m: Matrix44 | None = None
     if rotation:
-        m @= Matrix44.z_rotate(math.radians(rotation))
-
-    # calc bounding box of the final output canvas:
-    corners = m.transform_vertices(bbox.rect_vertices())
-    canvas = BoundingBox2d(corners)
-
-    # shift content to first quadrant +x/+y
-    tx, ty = canvas.extmin
+        m = Matrix44.scale(sx, sy, 1.0) @ Matrix44.z_rotate(math.radians(rotation))
+        # calc extents of the final output canvas, transforming the 4 corners of
+        # the bbox is sufficient, m contains only 2D transformations:
+        corners = list(m.fast_2d_transform(bbox.rect_vertices()))
+        xs = [v.x for v in corners]
+        ys = [v.y for v in corners]
+        # shift content to first quadrant +x/+y
+        tx = min(xs)
+        ty = min(ys)
+        canvas_width = max(xs) - tx
+        canvas_height = max(ys) - ty
+    else:  # the common case: scaling only
+        if not bbox.has_data:
+            raise ValueError("empty bounding box")
+        x0, y0 = bbox.extmin
+        x1, y1 = bbox.extmax
+        tx = min(x0 * sx, x1 * sx)
+        ty = min(y0 * sy, y1 * sy)
+        canvas_width = abs((x1 - x0) * sx)
+        canvas_height = abs((y1 - y0) * sy)
 
     # align content within margins
-    view_box_content_x = (
-        page.width_in_mm - margins.left - margins.right
-    ) * scale_mm_to_vb
-    view_box_content_y = (
-        page.height_in_mm - margins.top - margins.bottom
-    ) * scale_mm_to_vb
-    dx = view_box_content_x - canvas.size.x
-    dy = view_box_content_y - canvas.size.y
+    view_box_content_x = (page_width - margins.left - margins.right) * scale_mm_to_vb
+    view_box_content_y = (page_height - margins.top - margins.bottom) * scale_mm_to_vb
+    dx = view_box_content_x - canvas_width
+    dy = view_box_content_y - canvas_height
     offset_x = margins.left * scale_mm_to_vb  # left
     if top_origin:
         offset_y = margins.top * scale_mm_to_vb
@@ -508,6 +520,15 @@ def placement_matrix(
     else:  # top aligned
         if not top_origin:
             offset_y += dy
+    if m is None:
+        # fmt: off
+        return Matrix44((
+            sx, 0.0, 0.0, 0.0,
+            0.0, sy, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            offset_x - tx, offset_y - ty, 0.0, 1.0,
+        ))
+        # fmt: on
     return m @ Matrix44.translate(-tx + offset_x, -ty + offset_y, 0)
 
 
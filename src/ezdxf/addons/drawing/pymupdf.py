@@ -63,7 +63,7 @@ class PyMuPdfBackend(recorder.Recorder):
         self,
         page: layout.Page,
         *,
-        settings: layout.Settings = layout.Settings(),
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
         render_box: BoundingBox2d | None = None,
     ) -> PyMuPdfRenderBackend:
         """Returns the PDF document as bytes.
@@ -109,7 +109,7 @@ class PyMuPdfBackend(recorder.Recorder):
         self,
         page: layout.Page,
         *,
-        settings: layout.Settings = layout.Settings(),
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
         render_box: BoundingBox2d | None = None,
     ) -> bytes:
         """Returns the PDF document as bytes.
@@ -127,7 +127,7 @@ class PyMuPdfBackend(recorder.Recorder):
         page: layout.Page,
         *,
         fmt="png",
-        settings: layout.Settings = layout.Settings(),
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
         dpi: int = 96,
         alpha=False,
         render_box: BoundingBox2d | None = None,
@@ -13,6 +13,9 @@ from typing_extensions import Self, TypeAlias
 import copy
 import abc
 
+import numpy as np
+import numpy.typing as npt
+
 from ezdxf.math import BoundingBox2d, Matrix44, Vec2, UVec
 from ezdxf.npshapes import NumpyPath2d, NumpyPoints2d, EmptyShapeError
 from ezdxf.tools import take2
@@ -24,7 +27,12 @@ from .properties import BackendProperties
 from .type_hints import Color
 
 
+_IDENTITY = tuple(Matrix44())
+
+
 class DataRecord(abc.ABC):
+    __slots__ = ("property_hash", "handle")
+
     def __init__(self) -> None:
         self.property_hash: int = 0
         self.handle: str = ""
@@ -34,12 +42,30 @@ class DataRecord(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def transform_inplace(self, m: Matrix44) -> None:
+    def np_vertices(self) -> Iterator[npt.NDArray]:
+        """Yields the vertices of all shapes of the record as ndarrays. These are the
+        vertex arrays of the shapes and not copies, changes are applied inplace!
+        """
         ...
 
+    @abc.abstractmethod
+    def transform_extra(self, m: Matrix44) -> None:
+        """Transforms the state of the record which is not stored in the vertex arrays
+        returned by :meth:`np_vertices`. The vertices are transformed by the caller.
+        """
+        ...
+
+    def transform_inplace(self, m: Matrix44) -> None:
+        for vertices in self.np_vertices():
+            if len(vertices):
+                m.transform_array_inplace(vertices, 2)
+        self.transform_extra(m)
+
 
 class PointsRecord(DataRecord):
     # n=1 point; n=2 line; n>2 filled polygon
+    __slots__ = ("points",)
+
     def __init__(self, points: NumpyPoints2d) -> None:
         super().__init__()
         self.points: NumpyPoints2d = points
@@ -51,11 +77,16 @@ class PointsRecord(DataRecord):
             pass
         return BoundingBox2d()
 
-    def transform_inplace(self, m: Matrix44) -> None:
-        self.points.transform_inplace(m)
+    def np_vertices(self) -> Iterator[npt.NDArray]:
+        yield self.points.np_vertices()
+
+    def transform_extra(self, m: Matrix44) -> None:
+        pass
 
 
 class SolidLinesRecord(DataRecord):
+    __slots__ = ("lines",)
+
     def __init__(self, lines: NumpyPoints2d) -> None:
         super().__init__()
         self.lines: NumpyPoints2d = lines
@@ -67,11 +98,16 @@ class SolidLinesRecord(DataRecord):
             pass
         return BoundingBox2d()
 
-    def transform_inplace(self, m: Matrix44) -> None:
-        self.lines.transform_inplace(m)
+    def np_vertices(self) -> Iterator[npt.NDArray]:
+        yield self.lines.np_vertices()
+
+    def transform_extra(self, m: Matrix44) -> None:
+        pass
 
 
 class PathRecord(DataRecord):
+    __slots__ = ("path",)
+
     def __init__(self, path: NumpyPath2d) -> None:
         super().__init__()
         self.path: NumpyPath2d = path
@@ -83,11 +119,16 @@ class PathRecord(DataRecord):
             pass
         return BoundingBox2d()
 
-    def transform_inplace(self, m: Matrix44) -> None:
-        self.path.transform_inplace(m)
+    def np_vertices(self) -> Iterator[npt.NDArray]:
+        yield self.path.np_vertices()
+
+    def transform_extra(self, m: Matrix44) -> None:
+        pass
 
 
 class FilledPathsRecord(DataRecord):
+    __slots__ = ("paths",)
+
     def __init__(self, paths: Sequence[NumpyPath2d]) -> None:
         super().__init__()
         self.paths: Sequence[NumpyPath2d] = paths
@@ -99,12 +140,17 @@ class FilledPathsRecord(DataRecord):
                 bbox.extend(path.extents())
         return bbox
 
-    def transform_inplace(self, m: Matrix44) -> None:
+    def np_vertices(self) -> Iterator[npt.NDArray]:
         for path in self.paths:
-            path.transform_inplace(m)
+            yield path.np_vertices()
+
+    def transform_extra(self, m: Matrix44) -> None:
+        pass
 
 
 class ImageRecord(DataRecord):
+    __slots__ = ("boundary", "image_data")
+
     def __init__(self, boundary: NumpyPoints2d, image_data: ImageData) -> None:
         super().__init__()
         self.boundary: NumpyPoints2d = boundary
@@ -117,8 +163,10 @@ class ImageRecord(DataRecord):
             pass
         return BoundingBox2d()
 
-    def transform_inplace(self, m: Matrix44) -> None:
-        self.boundary.transform_inplace(m)
+    def np_vertices(self) -> Iterator[npt.NDArray]:
+        yield self.boundary.np_vertices()
+
+    def transform_extra(self, m: Matrix44) -> None:
         self.image_data.transform @= m
 
 
@@ -310,8 +358,23 @@ class Player:
         """Transforms the recordings inplace by a transformation matrix `m` of type
         :class:`~ezdxf.math.Matrix44`.
         """
+        if tuple(m) == _IDENTITY:
+            return  # nothing to do
+        arrays: list[npt.NDArray] = []
         for record in self.records:
-            record.transform_inplace(m)
+            # empty shapes have the shape (0,) and cannot be concatenated:
+            arrays.extend(v for v in record.np_vertices() if len(v))
+            record.transform_extra(m)
+        if arrays:
+            # Transform the vertices of all records at once, transforming many small
+            # arrays one by one has a large overhead:
+            vertices = np.concatenate(arrays)
+            m.transform_array_inplace(vertices, 2)
+            start = 0
+            for array in arrays:
+                end = start + len(array)
+                array[:] = vertices[start:end]
+                start = end
 
         if self._bbox.has_data:
             # works for 90-, 180- and 270-degree rotation
@@ -324,9 +387,16 @@ class Player:
         return self._bbox
 
     def update_bbox(self) -> None:
-        bbox = BoundingBox2d()
+        # Collect the vertices of all records and determine the extents in a single
+        # pass, calculating the bounding box record by record is much slower:
+        arrays: list[npt.NDArray] = []
         for record in self.records:
-            bbox.extend(record.bbox())
+            # empty shapes have the shape (0,) and cannot be concatenated:
+            arrays.extend(v for v in record.np_vertices() if len(v))
+        bbox = BoundingBox2d()
+        if arrays:
+            vertices = np.concatenate(arrays)
+            bbox = BoundingBox2d((vertices.min(0), vertices.max(0)))
         self._bbox = bbox
 
     def crop_rect(self, p1: UVec, p2: UVec, distance: float) -> None:
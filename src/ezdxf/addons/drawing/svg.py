@@ -1,7 +1,7 @@
 #  Copyright (c) 2023, Manfred Moitzi
 #  License: MIT License
 from __future__ import annotations
-from typing import Iterable, Sequence, no_type_check
+from typing import Iterable, Sequence
 
 import copy
 from xml.etree import ElementTree as ET
@@ -34,9 +34,23 @@ class SVGBackend(recorder.Recorder):
         self,
         page: layout.Page,
         *,
-        settings: layout.Settings = layout.Settings(),
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
         render_box: BoundingBox2d | None = None,
     ) -> ET.Element:
+        backend = self._render(page, settings, render_box)
+        if backend is None:
+            return ET.Element("svg")  # empty page
+        return backend.get_xml_root_element()
+
+    def _render(
+        self,
+        page: layout.Page,
+        settings: layout.Settings,
+        render_box: BoundingBox2d | None,
+    ) -> SVGRenderBackend | None:
+        """Replays the recordings on a new render backend, returns ``None`` for an
+        empty page.
+        """
         top_origin = True
         settings = copy.copy(settings)
         # DXF coordinates are mapped to integer viewBox coordinates in the first
@@ -53,7 +67,7 @@ class SVGBackend(recorder.Recorder):
         output_layout = layout.Layout(render_box, flip_y=self._init_flip_y)
         page = output_layout.get_final_page(page, settings)
         if page.width == 0 or page.height == 0:
-            return ET.Element("svg")  # empty page
+            return None  # empty page
 
         m = output_layout.get_placement_matrix(
             page, settings=settings, top_origin=top_origin
@@ -71,13 +85,13 @@ class SVGBackend(recorder.Recorder):
         self._init_flip_y = False
         backend = self.make_backend(page, settings)
         player.replay(backend)
-        return backend.get_xml_root_element()
+        return backend
 
     def get_string(
         self,
         page: layout.Page,
         *,
-        settings: layout.Settings = layout.Settings(),
+        settings: layout.Settings = layout.DEFAULT_SETTINGS,
         render_box: BoundingBox2d | None = None,
         xml_declaration=True,
     ) -> str:
@@ -91,8 +105,11 @@ class SVGBackend(recorder.Recorder):
                 in front of the <svg> element
 
         """
-        xml = self.get_xml_root_element(page, settings=settings, render_box=render_box)
-        return ET.tostring(xml, encoding="unicode", xml_declaration=xml_declaration)
+        backend = self._render(page, settings, render_box)
+        if backend is None:
+            xml = ET.Element("svg")  # empty page
+            return ET.tostring(xml, encoding="unicode", xml_declaration=xml_declaration)
+        return backend.get_string(xml_declaration=xml_declaration)
 
     @staticmethod
     def make_backend(page: layout.Page, settings: layout.Settings) -> SVGRenderBackend:
@@ -102,22 +119,53 @@ class SVGBackend(recorder.Recorder):
 
 def make_view_box(page: layout.Page, output_coordinate_space: float) -> tuple[int, int]:
     size = round(output_coordinate_space)
-    if page.width > page.height:
-        return size, round(size * (page.height / page.width))
-    return round(size * (page.width / page.height)), size
+    width = page.width
+    height = page.height
+    if width > height:
+        return size, round(size * (height / width))
+    if height == 0.0:  # empty page
+        return 0, 0
+    return round(size * (width / height)), size
 
 
 def scale_page_to_view_box(page: layout.Page, output_coordinate_space: float) -> float:
     # The viewBox coordinates are integer values in the range of [0, output_coordinate_space]
-    return min(
-        output_coordinate_space / page.width,
-        output_coordinate_space / page.height,
-    )
+    try:
+        return output_coordinate_space / max(page.width, page.height)
+    except ZeroDivisionError:
+        return 1.0
+
+
+MOVE_TO = int(Command.MOVE_TO)
+LINE_TO = int(Command.LINE_TO)
+CURVE3_TO = int(Command.CURVE3_TO)
+CURVE4_TO = int(Command.CURVE4_TO)
+
+# numpy has a large overhead for small arrays, paths with more commands are processed
+# by make_vectorized_path_str():
+VECTORIZE_PATH_THRESHOLD = 15
+# vertex count of path commands indexed by the command code
+VERTEX_COUNT = np.zeros(
+    max(MOVE_TO, LINE_TO, CURVE3_TO, CURVE4_TO) + 1, dtype=np.int64
+)
+VERTEX_COUNT[[MOVE_TO, LINE_TO, CURVE3_TO, CURVE4_TO]] = (1, 1, 2, 3)
+REL_CMD_TEMPLATES = {
+    MOVE_TO: "m %.0f %.0f",
+    LINE_TO: "l %.0f %.0f",
+    CURVE3_TO: "q %.0f %.0f %.0f %.0f",
+    CURVE4_TO: "c %.0f %.0f %.0f %.0f %.0f %.0f",
+}
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+GROUP_ATTRIBUTES = 'stroke-linecap="round" stroke-linejoin="round" fill-rule="evenodd"'
 
 
 class Styles:
-    def __init__(self, xml: ET.Element) -> None:
+    def __init__(self, xml: ET.Element | None = None) -> None:
+        # optional XML element to append the <style> elements
         self._xml = xml
+        self._styles: list[str] = []
         self._class_names: dict[int, str] = dict()
         self._counter = 1
 
@@ -149,20 +197,19 @@ class Styles:
         return name
 
     def _add_class(self, name, style_str: str) -> None:
-        style = ET.Element("style")
-        style.text = f".{name} {style_str}"
-        self._xml.append(style)
+        text = f".{name} {style_str}"
+        self._styles.append(text)
+        if self._xml is not None:
+            style = ET.Element("style")
+            style.text = text
+            self._xml.append(style)
 
-
-CMD_M_ABS = "M {0.x:.0f} {0.y:.0f}"
-CMD_M_REL = "m {0.x:.0f} {0.y:.0f}"
-CMD_L_ABS = "L {0.x:.0f} {0.y:.0f}"
-CMD_L_REL = "l {0.x:.0f} {0.y:.0f}"
-CMD_C3_ABS = "Q {0.x:.0f} {0.y:.0f} {1.x:.0f} {1.y:.0f}"
-CMD_C3_REL = "q {0.x:.0f} {0.y:.0f} {1.x:.0f} {1.y:.0f}"
-CMD_C4_ABS = "C {0.x:.0f} {0.y:.0f} {1.x:.0f} {1.y:.0f} {2.x:.0f} {2.y:.0f}"
-CMD_C4_REL = "c {0.x:.0f} {0.y:.0f} {1.x:.0f} {1.y:.0f} {2.x:.0f} {2.y:.0f}"
-CMD_CONT = "{0.x:.0f} {0.y:.0f}"
+    def get_string(self) -> str:
+        """Returns the <def> element of all style classes as string."""
+        if not self._styles:
+            return "<def />"
+        styles = "".join(f"<style>{style}</style>" for style in self._styles)
+        return f"<def>{styles}</def>"
 
 
 class SVGRenderBackend(BackendInterface):
@@ -183,12 +230,25 @@ class SVGRenderBackend(BackendInterface):
     def __init__(self, page: layout.Page, settings: layout.Settings) -> None:
         self.settings = settings
         self._stroke_width_cache: dict[float, int] = dict()
+        # style class names of strokes by (color, lineweight) and of fillings by color,
+        # strokes store also if they can be merged:
+        self._stroke_classes: dict[tuple[Color, float], tuple[str, bool]] = dict()
+        self._filling_classes: dict[Color, str] = dict()
+        # consecutive strokes of the same style are merged into a single <path>:
+        self._pending_stroke_class = ""
+        self._pending_strokes: list[str] = []
+        # points of the pending strokes by (color, lineweight, path data), a point
+        # drawn twice at the same location is added only once:
+        self._pending_points: set[tuple[Color, float, str]] = set()
         view_box_width, view_box_height = make_view_box(
             page, settings.output_coordinate_space
         )
         # StrokeWidthPolicy.absolute:
         # stroke-width in mm as resolved by the frontend
-        self.stroke_width_scale: float = view_box_width / page.width_in_mm
+        try:
+            self.stroke_width_scale: float = view_box_width / page.width_in_mm
+        except ZeroDivisionError:
+            self.stroke_width_scale = 1.0
         self.min_lineweight = 0.05  # in mm, set by configure()
         self.lineweight_scaling = 1.0  # set by configure()
         self.lineweight_policy = LineweightPolicy.ABSOLUTE  # set by configure()
@@ -210,51 +270,107 @@ class SVGRenderBackend(BackendInterface):
         self.fixed_stroke_width: int = int(
             self.max_stroke_width * settings.fixed_stroke_width
         )
-        self.root = ET.Element(
-            "svg",
-            xmlns="http://www.w3.org/2000/svg",
-            width=f"{page.width_in_mm:g}mm",
-            height=f"{page.height_in_mm:g}mm",
-            viewBox=f"0 0 {view_box_width} {view_box_height}",
+        self.header = (
+            f'<svg xmlns="{SVG_NAMESPACE}" '
+            f'width="{page.width_in_mm:g}mm" '
+            f'height="{page.height_in_mm:g}mm" '
+            f'viewBox="0 0 {view_box_width} {view_box_height}">'
         )
-        self.styles = Styles(ET.SubElement(self.root, "def"))
-        self.background = ET.SubElement(
-            self.root,
-            "rect",
-            fill="white",
-            x="0",
-            y="0",
-            width=str(view_box_width),
-            height=str(view_box_height),
+        self.styles = Styles()
+        self.view_box_size = (view_box_width, view_box_height)
+        self.background_color: Color = "white"
+        self.background_opacity: float | None = None  # not set
+        # The SVG <path> elements are stored as strings, building an ElementTree is
+        # much slower and the content is write-only:
+        self.entities: list[str] = []
+
+    def get_string(self, xml_declaration=True) -> str:
+        """Returns the XML data as unicode string."""
+        self.flush_strokes()
+        parts: list[str] = []
+        if xml_declaration:
+            parts.append(XML_DECLARATION)
+        parts.append(self.header)
+        parts.append(self.styles.get_string())
+        parts.append(self.get_background_string())
+        if self.entities:
+            parts.append(f"<g {GROUP_ATTRIBUTES}>")
+            parts.extend(self.entities)
+            parts.append("</g>")
+        else:
+            parts.append(f"<g {GROUP_ATTRIBUTES} />")
+        parts.append("</svg>")
+        return "".join(parts)
+
+    def get_background_string(self) -> str:
+        """Returns the <rect> element of the background as string."""
+        width, height = self.view_box_size
+        opacity = ""
+        if self.background_opacity is not None:
+            opacity = f' fill-opacity="{self.background_opacity}"'
+        return (
+            f'<rect fill="{self.background_color}" x="0" y="0" '
+            f'width="{width}" height="{height}"{opacity} />'
         )
-        self.entities = ET.SubElement(self.root, "g")
-        self.entities.set("stroke-linecap", "round")
-        self.entities.set("stroke-linejoin", "round")
-        self.entities.set("fill-rule", "evenodd")
 
     def get_xml_root_element(self) -> ET.Element:
-        return self.root
+        root = ET.fromstring(self.get_string(xml_declaration=False))
+        # remove the namespace from the tags, which is added by the XML parser:
+        prefix = f"{{{SVG_NAMESPACE}}}"
+        for element in root.iter():
+            element.tag = element.tag.removeprefix(prefix)
+        root.attrib = {"xmlns": SVG_NAMESPACE, **root.attrib}
+        return root
 
     def add_strokes(self, d: str, properties: BackendProperties):
         if not d:
             return
-        element = ET.SubElement(self.entities, "path", d=d)
-        stroke_width = self.resolve_stroke_width(properties.lineweight)
-        stroke_color, stroke_opacity = self.resolve_color(properties.color)
-        cls = self.styles.get_class(
-            stroke=stroke_color,
-            stroke_width=stroke_width,
-            stroke_opacity=stroke_opacity,
-        )
-        element.set("class", cls)
+        key = (properties.color, properties.lineweight)
+        try:
+            cls, mergeable = self._stroke_classes[key]
+        except KeyError:
+            stroke_width = self.resolve_stroke_width(properties.lineweight)
+            stroke_color, stroke_opacity = self.resolve_color(properties.color)
+            cls = self.styles.get_class(
+                stroke=stroke_color,
+                stroke_width=stroke_width,
+                stroke_opacity=stroke_opacity,
+            )
+            # overlapping parts of a single translucent path are not blended:
+            mergeable = stroke_opacity == 1.0
+            self._stroke_classes[key] = cls, mergeable
+        if cls == self._pending_stroke_class:
+            self._pending_strokes.append(d)
+            return
+        self.flush_strokes()
+        if mergeable:
+            self._pending_stroke_class = cls
+            self._pending_strokes.append(d)
+        else:
+            self.entities.append(f'<path d="{d}" class="{cls}" />')
+
+    def flush_strokes(self) -> None:
+        """Writes the pending strokes as a single <path> element."""
+        if self._pending_strokes:
+            d = " ".join(self._pending_strokes)
+            cls = self._pending_stroke_class
+            self.entities.append(f'<path d="{d}" class="{cls}" />')
+            self._pending_strokes.clear()
+            self._pending_points.clear()
+        self._pending_stroke_class = ""
 
     def add_filling(self, d: str, properties: BackendProperties):
         if not d:
             return
-        element = ET.SubElement(self.entities, "path", d=d)
-        fill_color, fill_opacity = self.resolve_color(properties.color)
-        cls = self.styles.get_class(fill=fill_color, fill_opacity=fill_opacity)
-        element.set("class", cls)
+        color = properties.color
+        try:
+            cls = self._filling_classes[color]
+        except KeyError:
+            fill_color, fill_opacity = self.resolve_color(color)
+            cls = self.styles.get_class(fill=fill_color, fill_opacity=fill_opacity)
+            self._filling_classes[color] = cls
+        self.flush_strokes()
+        self.entities.append(f'<path d="{d}" class="{cls}" />')
 
     def resolve_color(self, color: Color) -> tuple[Color, float]:
         return color[:7], alpha_to_opacity(color[7:9])
@@ -264,7 +380,8 @@ class SVGRenderBackend(BackendInterface):
             return self._stroke_width_cache[width]
         except KeyError:
             pass
-            stroke_width = self.fixed_stroke_width
+        lineweight = width  # the original value is the cache key
+        stroke_width = self.fixed_stroke_width
         policy = self.lineweight_policy
         if policy == LineweightPolicy.ABSOLUTE:
             if self.lineweight_scaling:
@@ -276,17 +393,24 @@ class SVGRenderBackend(BackendInterface):
             stroke_width = map_lineweight_to_stroke_width(
                 width, self.min_stroke_width, self.max_stroke_width
             )
-        self._stroke_width_cache[width] = stroke_width
+        self._stroke_width_cache[lineweight] = stroke_width
         return stroke_width
 
     def set_background(self, color: Color) -> None:
         color_str = color[:7]
         opacity = alpha_to_opacity(color[7:9])
-        self.background.set("fill", color_str)
-        self.background.set("fill-opacity", str(opacity))
+        self.background_color = color_str
+        self.background_opacity = opacity
 
     def draw_point(self, pos: Vec2, properties: BackendProperties) -> None:
-        self.add_strokes(self.make_polyline_str([pos, pos]), properties)
+        # a zero-length line is rendered as dot by the round line caps:
+        d = f"M {pos.x:.0f} {pos.y:.0f} l 0 0"
+        key = (properties.color, properties.lineweight, d)
+        if key in self._pending_points:
+            return
+        self.add_strokes(d, properties)
+        if self._pending_stroke_class:  # translucent strokes are not merged
+            self._pending_points.add(key)
 
     def draw_line(self, start: Vec2, end: Vec2, properties: BackendProperties) -> None:
         self.add_strokes(self.make_polyline_str([start, end]), properties)
@@ -314,9 +438,7 @@ class SVGRenderBackend(BackendInterface):
     def draw_filled_polygon(
         self, points: BkPoints2d, properties: BackendProperties
     ) -> None:
-        self.add_filling(
-            self.make_polyline_str(points.vertices(), close=True), properties
-        )
+        self.add_filling(self.make_polygon_str(points.np_vertices()), properties)
 
     def draw_image(self, image_data: ImageData, properties: BackendProperties) -> None:
         pass  # TODO: not implemented
@@ -325,53 +447,99 @@ class SVGRenderBackend(BackendInterface):
     def make_polyline_str(points: Sequence[Vec2], close=False) -> str:
         if len(points) < 2:
             return ""
-        current = points[0]
+        it = iter(points)
+        current = next(it)
+        cx = current.x
+        cy = current.y
         # first move is absolute, consecutive lines are relative:
-        d: list[str] = [CMD_M_ABS.format(current), "l"]
-        for point in points[1:]:
-            relative = point - current
-            current = point
-            d.append(CMD_CONT.format(relative))
+        d: list[str] = [f"M {cx:.0f} {cy:.0f}", "l"]
+        append = d.append
+        for point in it:
+            x = point.x
+            y = point.y
+            append(f"{x - cx:.0f} {y - cy:.0f}")
+            cx = x
+            cy = y
         if close:
             d.append("Z")
         return " ".join(d)
 
+    @staticmethod
+    def make_polygon_str(vertices: np.ndarray) -> str:
+        """Returns the path data of a closed polygon, the `vertices` are stored in a
+        numpy array of shape (n, 2).
+        """
+        if len(vertices) < 2:
+            return ""
+        x, y = vertices[0]
+        # format all relative coordinates at once, rounded like make_polyline_str():
+        deltas = np.diff(vertices, axis=0)
+        template = " ".join(["%.0f %.0f"] * len(deltas))
+        return f"M {x:.0f} {y:.0f} l {template % tuple(deltas.ravel().tolist())} Z"
+
     @staticmethod
     def make_multi_line_str(lines: Sequence[tuple[Vec2, Vec2]]) -> str:
         assert len(lines) > 0
         start, end = lines[0]
-        d: list[str] = [CMD_M_ABS.format(start), CMD_L_REL.format(end - start)]
-        current = end
-        for start, end in lines[1:]:
-            d.append(CMD_M_REL.format(start - current))
-            current = start
-            d.append(CMD_L_REL.format(end - current))
-            current = end
+        x0, y0 = start.x, start.y
+        x1, y1 = end.x, end.y
+        d: list[str] = [f"M {x0:.0f} {y0:.0f}", f"l {x1 - x0:.0f} {y1 - y0:.0f}"]
+        append = d.append
+        it = iter(lines)
+        next(it)
+        for start, end in it:
+            x0, y0 = start.x, start.y
+            if x0 == x1 and y0 == y1:
+                # connected lines continue the previous "l" command
+                x1, y1 = end.x, end.y
+                append(f"{x1 - x0:.0f} {y1 - y0:.0f}")
+                continue
+            append(f"m {x0 - x1:.0f} {y0 - y1:.0f}")
+            x1, y1 = end.x, end.y
+            append(f"l {x1 - x0:.0f} {y1 - y0:.0f}")
         return " ".join(d)
 
     @staticmethod
-    @no_type_check
     def make_path_str(path: BkPath2d, close=False) -> str:
-        d: list[str] = [CMD_M_ABS.format(path.start)]
-        if len(path) == 0:
+        count = len(path)
+        if count == 0:
             return ""
-
-        current = path.start
-        for cmd in path.commands():
-            end = cmd.end
-            if cmd.type == Command.MOVE_TO:
-                d.append(CMD_M_REL.format(end - current))
-            elif cmd.type == Command.LINE_TO:
-                d.append(CMD_L_REL.format(end - current))
-            elif cmd.type == Command.CURVE3_TO:
-                d.append(CMD_C3_REL.format(cmd.ctrl - current, end - current))
-            elif cmd.type == Command.CURVE4_TO:
-                d.append(
-                    CMD_C4_REL.format(
-                        cmd.ctrl1 - current, cmd.ctrl2 - current, end - current
-                    )
+        if count > VECTORIZE_PATH_THRESHOLD:
+            return make_vectorized_path_str(path, close)
+        # work with plain floats, creating Vec2 and path element objects for each
+        # command is expensive:
+        vertices = path.np_vertices().tolist()
+        cx, cy = vertices[0]
+        d: list[str] = [f"M {cx:.0f} {cy:.0f}"]
+        append = d.append
+        index = 1
+        for cmd in path.command_codes():
+            if cmd == LINE_TO:
+                x, y = vertices[index]
+                append(f"l {x - cx:.0f} {y - cy:.0f}")
+                index += 1
+            elif cmd == CURVE4_TO:
+                x1, y1 = vertices[index]
+                x2, y2 = vertices[index + 1]
+                x, y = vertices[index + 2]
+                append(
+                    f"c {x1 - cx:.0f} {y1 - cy:.0f} {x2 - cx:.0f} {y2 - cy:.0f} "
+                    f"{x - cx:.0f} {y - cy:.0f}"
                 )
-            current = end
+                index += 3
+            elif cmd == CURVE3_TO:
+                x1, y1 = vertices[index]
+                x, y = vertices[index + 1]
+                append(f"q {x1 - cx:.0f} {y1 - cy:.0f} {x - cx:.0f} {y - cy:.0f}")
+                index += 2
+            elif cmd == MOVE_TO:
+                x, y = vertices[index]
+                append(f"m {x - cx:.0f} {y - cy:.0f}")
+                index += 1
+            else:
+                continue
+            cx = x
+            cy = y
         if close:
             d.append("Z")
 
@@ -389,7 +557,7 @@ class SVGRenderBackend(BackendInterface):
         pass
 
     def finalize(self) -> None:
-        pass
+        self.flush_strokes()
 
     def enter_entity(self, entity, properties) -> None:
         pass
@@ -398,6 +566,28 @@ class SVGRenderBackend(BackendInterface):
         pass
 
 
+def make_vectorized_path_str(path: BkPath2d, close=False) -> str:
+    """Returns the SVG path data of `path`. The relative coordinates are calculated
+    and formatted all at once, which is much faster than processing each command for
+    large paths. The result is the same as the output of
+    :meth:`SVGRenderBackend.make_path_str`.
+    """
+    vertices = path.np_vertices()
+    codes = path.command_codes()
+    counts = VERTEX_COUNT[codes]
+    # index of the current point (the end point of the previous command) for each
+    # command, the first vertex is the start point of the path:
+    current = np.cumsum(counts) - counts
+    rel = vertices[1:] - np.repeat(vertices[current], counts, axis=0)
+    x, y = vertices[0]
+    template = " ".join([f"M {x:.0f} {y:.0f}", *map(REL_CMD_TEMPLATES.get, codes)])
+    if close:
+        template += " Z"
+    # formatting by "%.0f" rounds like the f-strings of the scalar implementation,
+    # converting rounded values to int would replace "-0" by "0":
+    return template % tuple(rel.ravel().tolist())
+
+
 def alpha_to_opacity(alpha: str) -> float:
     # stroke-opacity: 0.0 = transparent; 1.0 = opaque
     # alpha: "00" = transparent; "ff" = opaque
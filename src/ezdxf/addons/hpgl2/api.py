@@ -2,7 +2,6 @@
 #  License: MIT License
 from __future__ import annotations
 import enum
-from xml.etree import ElementTree as ET
 
 import ezdxf
 from ezdxf.document import Drawing
@@ -195,8 +194,7 @@ def to_svg(
     svg_backend = svg.SVGRenderBackend(page, settings)
     xplayer.hpgl2_to_drawing(player, svg_backend, bg_color="#ffffff")
     del player
-    xml = svg_backend.get_xml_root_element()
-    return ET.tostring(xml, encoding="unicode", xml_declaration=True)
+    return svg_backend.get_string(xml_declaration=True)
 
 
 def to_pdf(
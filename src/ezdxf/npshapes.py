@@ -201,7 +201,7 @@ class NumpyPath2d(NumpyShape2d):
 
     def command_codes(self) -> list[int]:
         """Internal API."""
-        return list(self._commands)
+        return self._commands.tolist()
 
     def commands(self) -> Iterator[PathElement]:
         vertices = self.vertices()
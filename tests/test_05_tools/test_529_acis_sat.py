@@ -47,6 +47,16 @@ def test_dump_header_string(ver, s):
     assert "\n".join(header.dumps()) == s
 
 
+def test_header_string_is_updated_after_changes():
+    header = hdr.AcisHeader()
+    header.creation_date = datetime(2022, 1, 1, 10, 00)
+    assert header.dumps()[1].endswith("@24 Sat Jan  1 10:00:00 2022 ")
+    header.creation_date = datetime(2023, 2, 3, 10, 00)
+    assert header.dumps()[1].endswith("@24 Fri Feb  3 10:00:00 2023 ")
+    header.set_version(400)
+    assert header.dumps()[1].endswith(" 24 Fri Feb  3 10:00:00 2023 ")
+
+
 @pytest.mark.parametrize(
     "s",
     [
@@ -63,6 +73,37 @@ def test_parse_header_str(s):
     ]
 
 
+@pytest.mark.parametrize(
+    "s",
+    [
+        "Sat Jan  1 10:00:00 2022",
+        "Sun Dec 31 23:59:58 2023",
+        "Sat Jan 1 10:00:00 2022",  # fallback to strptime()
+    ],
+)
+def test_parse_ctime(s):
+    assert hdr.parse_ctime(s) == datetime.strptime(s, const.DATE_FMT)
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "Sat Xyz  1 10:00:00 2022",  # invalid month
+        "Xyz Jan  1 10:00:00 2022",  # invalid weekday
+        "Tue May 15 23:21x04 7612",  # invalid time separator
+        "Tue May 15 23x21:04 7612",  # invalid time separator
+        "Tue May +5 23:21:04 2012",  # invalid day
+        "Tue May 15 +3:21:04 2012",  # invalid hour
+        "Tue May 15 23:-1:04 2012",  # invalid minute
+        "Tue May 15 23:21:+4 2012",  # invalid second
+        "Tue May 15 23:21:04 +012",  # invalid year
+    ],
+)
+def test_parse_invalid_ctime_raises_exception(s):
+    with pytest.raises(ValueError):
+        hdr.parse_ctime(s)
+
+
 @pytest.mark.parametrize("hdr,ver", [(HEADER_400, 400), (HEADER_21800, 21800)])
 def test_parse_sat_header(hdr, ver):
     header, data = sat.parse_header(hdr.split("\n"))
@@ -150,6 +191,16 @@ class TestParseRecords:
         assert records[1] == ["test", "1", "2", "3", "4", "5", "6"]
         assert records[2] == ["sentinel", "8"]
 
+    def test_weird_placement_of_record_terminator(self):
+        records = sat.parse_records(
+            ["eye 1 #", "attrib 2 #torus-surface 3", "4 #", "End-of-ACIS-data"]
+        )
+        assert records == [
+            ["eye", "1"],
+            ["attrib", "2"],
+            ["torus-surface", "3", "4"],
+        ]
+
 
 def test_build_entities(prism_sat):
     data = prism_sat.splitlines()
@@ -160,6 +211,12 @@ def test_build_entities(prism_sat):
     assert entities[112].name == "straight-curve"
 
 
+def test_build_entities_does_not_modify_records():
+    records = [["body", "$-1", "0", "$1", "$-1", "$-1"]]
+    sat.build_entities(records, 700)
+    assert records == [["body", "$-1", "0", "$1", "$-1", "$-1"]]
+
+
 class TestAcisBuilder:
     @pytest.fixture(scope="class")
     def builder(self, prism_sat):
@@ -180,6 +237,11 @@ class TestAcisBuilder:
         assert builder.entities[0].name == "body"
         assert builder.entities[112].name == "straight-curve"
 
+    def test_query_type(self, builder):
+        assert len(list(builder.query_type("body"))) == 1
+        assert len(list(builder.query_type("face"))) == 10
+        assert len(list(builder.query_type("xyz"))) == 0
+
     def test_attr_ptr_is_reset(self, builder):
         assert all(e.attr_ptr == "$-1" for e in builder.entities)
 
@@ -200,5 +262,30 @@ def test_build_str_records():
     assert s[2] == "test3 $-1 -1 $0 $1 #"
 
 
+def test_build_str_records_with_unlinked_entity_raises_exception():
+    a = sat.new_entity("test1")
+    b = sat.new_entity("test2", data=[a])
+    with pytest.raises(const.InvalidLinkStructure):
+        list(sat.build_str_records([b], 700))
+
+
+class TestSatDataLoader:
+    def test_read_vec3(self):
+        loader = sat.SatDataLoader(["1", "2.5", "-3", "4"], 700)
+        assert loader.read_vec3() == (1.0, 2.5, -3.0)
+        assert loader.read_double() == 4.0
+
+    def test_read_transform(self):
+        data = [str(i) for i in range(12)] + ["1", "no_rotate"]
+        loader = sat.SatDataLoader(data, 700)
+        assert loader.read_transform() == [float(i) for i in range(12)]
+        assert loader.read_double() == 1.0
+
+    def test_read_invalid_vec3_raises_exception(self):
+        loader = sat.SatDataLoader(["1", "2", "x"], 700)
+        with pytest.raises(sat.ParsingError):
+            loader.read_vec3()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
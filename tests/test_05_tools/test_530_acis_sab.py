@@ -70,5 +70,24 @@ class TestSabEntity:
         assert body.attributes.is_null_ptr is False
 
 
+
+class TestBuildSabRecords:
+    def test_encode_pointers_as_record_index(self):
+        body = sab.SabEntity("body")
+        lump = sab.SabEntity("lump")
+        body.attributes = sab.NULL_PTR
+        lump.attributes = sab.NULL_PTR
+        body.data = [sab.Token(T.POINTER, lump), sab.Token(T.POINTER, sab.NULL_PTR)]
+        records = list(sab.build_sab_records([body, lump]))
+        assert records[0][1] == sab.Token(T.POINTER, -1)  # attributes
+        assert records[0][3:] == [sab.Token(T.POINTER, 1), sab.Token(T.POINTER, -1)]
+
+    def test_pointer_to_unknown_entity_raises_exception(self):
+        body = sab.SabEntity("body")
+        body.attributes = sab.SabEntity("attrib")
+        with pytest.raises(sab.InvalidLinkStructure):
+            list(sab.build_sab_records([body]))
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -3,7 +3,7 @@
 
 import pytest
 from ezdxf.acis.api import load, export_sat, export_sab, ExportError
-from ezdxf.acis import sat, sab, entities, hdr, const, mesh
+from ezdxf.acis import sat, sab, entities, hdr, const, mesh, abstract
 from ezdxf.math import Matrix44
 import math
 
@@ -399,5 +399,63 @@ class TestExportTransform:
         )
 
 
+class TestRestoreEntity:
+    def test_restore_expected_type(self):
+        loader = sat.SatDataLoader([sat.SatEntity("plane-surface")], 700)
+        e = entities.restore_entity("surface", loader, lambda raw: raw.name)
+        assert e == "plane-surface"
+
+    def test_restore_null_ptr(self):
+        loader = sat.SatDataLoader([sat.NULL_PTR], 700)
+        e = entities.restore_entity("surface", loader, lambda raw: raw.name)
+        assert e is entities.NONE_REF
+
+    def test_reuse_prebuilt_restore_functions(self):
+        loader = sat.SatDataLoader([sat.SatEntity("lump")], 700)
+        entities.restore_entity("lump", loader, lambda raw: raw.name)
+        assert entities._RESTORE_FUNCTIONS["lump"] is entities._restore_lump
+
+    def test_unexpected_type_raises_exception(self):
+        loader = sat.SatDataLoader([sat.SatEntity("edge")], 700)
+        with pytest.raises(const.ParsingError):
+            entities.restore_entity("surface", loader, lambda raw: raw.name)
+
+
+def test_pattern_does_not_load_any_data():
+    loader = sat.SatDataLoader(["$1", "$2"], 700)
+    e = entities.Pattern()
+    e.load(loader, lambda _: entities.NONE_REF)
+    assert loader.index == 0
+
+
+@pytest.mark.parametrize("cls", [entities.Wire, entities.Subshell, entities.PCurve])
+def test_unsupported_entities_load_the_pattern_pointer(cls):
+    pattern = entities.Pattern()
+    loader = sat.SatDataLoader([sat.SatEntity("pattern")], 700)
+    e = cls()
+    e.load(loader, lambda _: pattern)
+    assert e.pattern is pattern
+
+
+def test_write_ptrs_has_a_default_implementation():
+    # adding abstract methods breaks existing DataExporter implementations
+    assert "write_ptrs" not in abstract.DataExporter.__abstractmethods__
+
+
+@pytest.mark.parametrize("version,expected", [(400, False), (700, True)])
+def test_loader_has_tol_modeling(version, expected):
+    assert sat.SatDataLoader([], version).has_tol_modeling is expected
+    assert sab.SabDataLoader([], version).has_tol_modeling is expected
+
+
+def test_loader_reset_has_a_default_implementation():
+    assert "reset" not in abstract.DataLoader.__abstractmethods__
+    loader = sat.SatDataLoader(["$1", "$2"], 700)
+    loader.index = 2
+    loader.reset(["$3"])
+    assert loader.data == ["$3"]
+    assert loader.index == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -207,6 +207,23 @@ def test_body_from_menger_sponge_is_manifold():
     assert debugger.is_manifold() is True
 
 
+def test_debugger_traverses_deep_link_structures():
+    # the linked list of faces is deeper than the default recursion limit
+    cylinder = forms.cylinder(count=1200)
+    body = body_from_mesh(cylinder)
+    debugger = dbg.AcisDebugger(body)
+    faces = list(debugger.filter_type("face"))
+    assert len(faces) == 1202
+    assert len(set(e.id for e in debugger.walk())) == len(debugger.entities)
+
+
+def test_debugger_filter_type_after_resetting_entities():
+    debugger = dbg.AcisDebugger(body_from_mesh(forms.cube()))
+    assert len(list(debugger.filter_type("face"))) == 6
+    debugger.set_entities(body_from_mesh(forms.cylinder(count=8)))
+    assert len(list(debugger.filter_type("face"))) == 10
+
+
 def test_vertices_from_body():
     cube = forms.cube()
     body = body_from_mesh(cube)
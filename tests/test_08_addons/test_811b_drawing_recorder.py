@@ -2,13 +2,21 @@
 # License: MIT License
 
 import pytest
+import numpy as np
 import ezdxf
 import ezdxf.path
-from ezdxf.npshapes import NumpyPath2d
-from ezdxf.math import Vec2
+from ezdxf.npshapes import NumpyPath2d, NumpyPoints2d
+from ezdxf.math import Vec2, Matrix44
 from ezdxf.addons.drawing import RenderContext, Frontend
-from ezdxf.addons.drawing.recorder import Recorder, BackendProperties, Override, FilledPathsRecord
+from ezdxf.addons.drawing.recorder import (
+    Recorder,
+    BackendProperties,
+    Override,
+    FilledPathsRecord,
+    ImageRecord,
+)
 from ezdxf.addons.drawing.debug_backend import PathBackend
+from ezdxf.addons.drawing.backend import ImageData
 
 
 class MyTestFrontend(Frontend):
@@ -153,6 +161,57 @@ def test_bounding_box(msp, frontend):
     assert bbox.extmax.isclose((200, 100))
 
 
+def test_bounding_box_of_mixed_records():
+    recorder = Recorder()
+    properties = BackendProperties()
+    recorder.draw_point(Vec2(-1, 5), properties)
+    recorder.draw_line(Vec2(0, 0), Vec2(3, 2), properties)
+    recorder.draw_solid_lines([(Vec2(1, -2), Vec2(2, 0))], properties)
+    recorder.draw_path(NumpyPath2d(None), properties)  # empty path
+    bbox = recorder.player().bbox()
+    assert bbox.extmin.isclose((-1, -2))
+    assert bbox.extmax.isclose((3, 5))
+
+
+def test_bounding_box_of_empty_recordings():
+    assert Recorder().player().bbox().has_data is False
+
+
+def test_transform_recordings():
+    recorder = Recorder()
+    properties = BackendProperties()
+    recorder.draw_point(Vec2(1, 2), properties)
+    recorder.draw_path(NumpyPath2d(None), properties)  # empty path
+    recorder.draw_solid_lines([(Vec2(0, 0), Vec2(3, 4))], properties)
+    image = ImageData(
+        image=np.zeros((2, 2, 4), dtype=np.uint8),
+        transform=Matrix44(),
+        pixel_boundary_path=NumpyPoints2d(Vec2.list([(0, 0), (2, 0), (2, 2)])),
+    )
+    recorder.draw_image(image, properties)
+    player = recorder.player()
+    m = Matrix44.translate(10, 20, 0)
+    player.transform(m)
+
+    point, _, lines, image_record = player.records
+    assert point.points.vertices() == [Vec2(11, 22)]
+    assert lines.lines.vertices() == [Vec2(10, 20), Vec2(13, 24)]
+    assert image_record.boundary.vertices() == Vec2.list([(10, 20), (12, 20), (12, 22)])
+    assert image_record.image_data.transform.origin.isclose((10, 20))
+
+
+def test_transform_single_image_record():
+    image = ImageData(
+        image=np.zeros((2, 2, 4), dtype=np.uint8),
+        transform=Matrix44(),
+        pixel_boundary_path=NumpyPoints2d(Vec2.list([(0, 0), (2, 0), (2, 2)])),
+    )
+    record = ImageRecord(NumpyPoints2d(Vec2.list([(0, 0), (2, 0), (2, 2)])), image)
+    record.transform_inplace(Matrix44.translate(10, 20, 0))
+    assert record.boundary.vertices() == Vec2.list([(10, 20), (12, 20), (12, 22)])
+    assert record.image_data.transform.origin.isclose((10, 20))
+
+
 class TestCroppingRecords:
     """Clipping is tested in 822 and 618!"""
 
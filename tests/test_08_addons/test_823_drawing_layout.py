@@ -2,8 +2,9 @@
 #  License: MIT License
 
 import pytest
+import math
 
-from ezdxf.math import Vec2
+from ezdxf.math import Vec2, BoundingBox2d
 from ezdxf.addons.drawing import layout
 
 
@@ -146,5 +147,53 @@ class TestSettings:
             _ = layout.Settings(content_rotation=45)
 
 
+class TestPlacementMatrix:
+    @pytest.fixture
+    def bbox(self):
+        return BoundingBox2d([(-10, 20), (30, 40)])
+
+    @pytest.fixture
+    def page(self):
+        return layout.Page(100, 50, margins=layout.Margins(4, 3, 2, 1))
+
+    @pytest.mark.parametrize("sy", [2.0, -2.0])
+    @pytest.mark.parametrize("top_origin", [True, False])
+    @pytest.mark.parametrize("alignment", list(layout.PageAlignment))
+    def test_without_rotation_matches_rotation_by_360_deg(
+        self, bbox, page, sy, top_origin, alignment
+    ):
+        args = dict(
+            sx=1.5,
+            sy=sy,
+            page=page,
+            output_coordinate_space=1000,
+            page_alignment=alignment,
+            top_origin=top_origin,
+        )
+        m0 = layout.placement_matrix(bbox, rotation=0, **args)
+        m360 = layout.placement_matrix(bbox, rotation=360, **args)
+        assert all(math.isclose(a, b, abs_tol=1e-9) for a, b in zip(m0, m360))
+
+    def test_content_is_placed_in_first_quadrant(self, bbox, page):
+        m = layout.placement_matrix(
+            bbox, sx=1.0, sy=-1.0, rotation=0, page=page, output_coordinate_space=1000
+        )
+        canvas = BoundingBox2d(m.fast_2d_transform(bbox.rect_vertices()))
+        assert canvas.extmin.x > 0.0
+        assert canvas.extmin.y > 0.0
+
+    def test_empty_bbox_raises_exception(self, page):
+        with pytest.raises(ValueError):
+            layout.placement_matrix(
+                BoundingBox2d(), 1.0, 1.0, 0, page, output_coordinate_space=1000
+            )
+
+    def test_layout_replaces_zero_scaling(self, bbox, page):
+        output_layout = layout.Layout(bbox)
+        settings = layout.Settings(scale=0.0, fit_page=False)
+        m = output_layout.get_placement_matrix(page, settings)
+        assert m.get_row(0) == (1.0, 0.0, 0.0, 0.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -5,7 +5,8 @@ import pytest
 from xml.etree import ElementTree as ET
 
 from ezdxf.math import Vec2
-from ezdxf.npshapes import NumpyPoints2d
+from ezdxf.npshapes import NumpyPoints2d, NumpyPath2d
+from ezdxf.path import Path
 from ezdxf.addons.drawing import svg, layout
 from ezdxf.addons.drawing.properties import BackendProperties
 
@@ -37,6 +38,16 @@ class TestStyles:
             "fill: none; fill-opacity: 1.000;}</style>"
         )
 
+    def test_get_string(self):
+        styles = svg.Styles()
+        assert styles.get_string() == "<def />"
+        styles.get_class(stroke="black", stroke_width=10, stroke_opacity=0.5)
+        assert (
+            styles.get_string()
+            == "<def><style>.C1 {stroke: black; stroke-width: 10; stroke-opacity: 0.500; "
+            "fill: none; fill-opacity: 1.000;}</style></def>"
+        )
+
 
 class TestStrokeWidthMapping:
     def test_min_stroke_width(self):
@@ -55,6 +66,25 @@ class TestStrokeWidthMapping:
         assert svg.map_lineweight_to_stroke_width(2.11, 5, 211) == 211
 
 
+class TestViewBox:
+    def test_landscape_page(self):
+        assert svg.make_view_box(layout.Page(400, 300), 1000) == (1000, 750)
+
+    def test_portrait_page(self):
+        assert svg.make_view_box(layout.Page(300, 400), 1000) == (750, 1000)
+
+    def test_empty_page(self):
+        assert svg.make_view_box(layout.Page(0, 0), 1000) == (0, 0)
+
+    def test_scale_page_to_view_box(self):
+        assert svg.scale_page_to_view_box(layout.Page(400, 300), 1000) == 2.5
+        assert svg.scale_page_to_view_box(layout.Page(0, 0), 1000) == 1.0
+
+    def test_render_backend_for_empty_page(self):
+        backend = svg.SVGRenderBackend(layout.Page(0, 0), layout.Settings())
+        assert 'viewBox="0 0 0 0"' in backend.get_string()
+
+
 NS = {
     "http://www.w3.org/2000/svg": "",
 }
@@ -86,6 +116,173 @@ class TestSVGBackend:
         assert xml.attrib["viewBox"] == "0 0 1000000 750000"
 
 
+class TestSVGRenderBackend:
+    @pytest.fixture
+    def backend(self):
+        backend_ = svg.SVGRenderBackend(layout.Page(400, 300), layout.Settings())
+        properties = BackendProperties(color="#ff0000", lineweight=0.25)
+        backend_.draw_line(Vec2(0, 0), Vec2(100, 50), properties)
+        return backend_
+
+    def test_get_string(self, backend):
+        result = backend.get_string(xml_declaration=False)
+        assert result.startswith('<svg xmlns="http://www.w3.org/2000/svg"')
+        assert '<path d="M 0 0 l 100 50" class="C1" />' in result
+        assert result.endswith("</g></svg>")
+
+    def test_xml_root_element_is_equivalent_to_string(self, backend):
+        xml = backend.get_xml_root_element()
+        assert xml.tag == "svg"
+        assert xml.attrib["xmlns"] == "http://www.w3.org/2000/svg"
+        assert ET.tostring(xml, encoding="unicode") == backend.get_string(
+            xml_declaration=False
+        )
+
+    def test_resolve_stroke_width(self):
+        backend = svg.SVGRenderBackend(layout.Page(400, 300), layout.Settings())
+        backend.lineweight_scaling = 2.0
+        assert backend.resolve_stroke_width(0.25) == 1250
+        # the cache key is the lineweight and not the scaled lineweight
+        assert backend.resolve_stroke_width(0.5) == 2500
+        assert backend.resolve_stroke_width(0.25) == 1250
+
+    def test_reuse_style_classes(self, backend):
+        properties = BackendProperties(color="#ff0000", lineweight=0.25)
+        backend.draw_line(Vec2(0, 0), Vec2(1, 1), properties)
+        backend.draw_filled_polygon(
+            NumpyPoints2d(Vec2.list([(0, 0), (1, 0), (1, 1)])), properties
+        )
+        backend.draw_filled_polygon(
+            NumpyPoints2d(Vec2.list([(0, 0), (1, 0), (1, 1)])), properties
+        )
+        assert [e[-13:] for e in backend.entities] == [
+            'class="C1" />',  # merged strokes
+            'class="C2" />',
+            'class="C2" />',
+        ]
+
+    def test_merge_consecutive_strokes_of_same_style(self, backend):
+        red = BackendProperties(color="#ff0000", lineweight=0.25)
+        green = BackendProperties(color="#00ff00", lineweight=0.25)
+        backend.draw_line(Vec2(0, 0), Vec2(1, 1), red)
+        backend.draw_line(Vec2(0, 0), Vec2(2, 2), green)
+        backend.draw_point(Vec2(3, 3), green)
+        backend.finalize()
+        assert backend.entities == [
+            '<path d="M 0 0 l 100 50 M 0 0 l 1 1" class="C1" />',
+            '<path d="M 0 0 l 2 2 M 3 3 l 0 0" class="C2" />',
+        ]
+
+    def test_do_not_merge_translucent_strokes(self, backend):
+        red = BackendProperties(color="#ff000080", lineweight=0.25)
+        backend.draw_line(Vec2(0, 0), Vec2(1, 1), red)
+        backend.draw_line(Vec2(0, 0), Vec2(2, 2), red)
+        backend.finalize()
+        assert len(backend.entities) == 3
+
+    def test_add_duplicated_points_only_once(self, backend):
+        red = BackendProperties(color="#ff0000", lineweight=0.25)
+        backend.draw_point(Vec2(3, 3), red)
+        backend.draw_point(Vec2(4, 4), red)
+        backend.draw_point(Vec2(3.1, 2.9), red)
+        backend.finalize()
+        assert backend.entities == [
+            '<path d="M 0 0 l 100 50 M 3 3 l 0 0 M 4 4 l 0 0" class="C1" />',
+        ]
+
+    def test_add_duplicated_translucent_points(self, backend):
+        red = BackendProperties(color="#ff000080", lineweight=0.25)
+        backend.draw_point(Vec2(3, 3), red)
+        backend.draw_point(Vec2(3, 3), red)
+        backend.finalize()
+        assert len(backend.entities) == 3
+
+    def test_empty_content(self):
+        backend_ = svg.SVGRenderBackend(layout.Page(400, 300), layout.Settings())
+        xml = ET.fromstring(backend_.get_string())
+        assert len(xml[-1]) == 0  # <g> element without content
+
+
+class TestPathStrings:
+    def test_polyline_str(self):
+        points = Vec2.list([(0, 0), (10.4, 0), (10.6, 20), (0, 20)])
+        d = svg.SVGRenderBackend.make_polyline_str(points, close=True)
+        assert d == "M 0 0 l 10 0 0 20 -11 0 Z"
+
+    def test_polyline_str_requires_two_points(self):
+        assert svg.SVGRenderBackend.make_polyline_str([Vec2()]) == ""
+
+    def test_polygon_str(self):
+        points = NumpyPoints2d(Vec2.list([(0, 0), (10.4, 0), (10.6, 20), (0, 20)]))
+        d = svg.SVGRenderBackend.make_polygon_str(points.np_vertices())
+        assert d == "M 0 0 l 10 0 0 20 -11 0 Z"
+
+    def test_polygon_str_requires_two_points(self):
+        points = NumpyPoints2d(None)
+        assert svg.SVGRenderBackend.make_polygon_str(points.np_vertices()) == ""
+
+    def test_path_str(self):
+        p = Path((10, 10))
+        p.line_to((20, 10))
+        p.curve3_to((30, 20), (25, 10))
+        p.curve4_to((40, 20), (32, 25), (38, 25))
+        p.move_to((0, 0))
+        p.line_to((-5, 0))
+        d = svg.SVGRenderBackend.make_path_str(NumpyPath2d(p), close=True)
+        assert d == "M 10 10 l 10 0 q 5 0 10 10 c 2 5 8 5 10 0 m -40 -20 l -5 0 Z"
+
+    def test_vectorized_path_str(self):
+        p = Path((10, 10))
+        p.line_to((20, 10))
+        p.curve3_to((30, 20), (25, 10))
+        p.curve4_to((40, 20), (32, 25), (38, 25))
+        p.move_to((0, 0))
+        p.line_to((-5, 0))
+        d = svg.make_vectorized_path_str(NumpyPath2d(p), close=True)
+        assert d == "M 10 10 l 10 0 q 5 0 10 10 c 2 5 8 5 10 0 m -40 -20 l -5 0 Z"
+
+    def test_vectorized_path_str_is_equal_to_scalar_implementation(self):
+        p = Path((0.4, -0.4))
+        p.line_to((0.1, -0.1))  # relative "-0 0"
+        p.curve3_to((-0.2, 0.3), (0.0, -0.45))
+        p.curve4_to((10.5, -20.5), (0.2, 0.1), (-0.4, 0.4))
+        p.move_to((-0.5, 0.5))
+        p.line_to((-0.8, 0.3))
+        path = NumpyPath2d(p)
+        assert len(path) <= svg.VECTORIZE_PATH_THRESHOLD
+        scalar_result = svg.SVGRenderBackend.make_path_str(path, close=True)
+        assert "-0" in scalar_result
+        assert svg.make_vectorized_path_str(path, close=True) == scalar_result
+
+    def test_large_path_str(self):
+        p = Path()
+        for i in range(svg.VECTORIZE_PATH_THRESHOLD * 2):
+            p.line_to((i * 10.4, (i % 3) * 7.6))
+        p.curve4_to((0, 0), (20.5, 30.5), (10.5, 20.5))
+        d = svg.SVGRenderBackend.make_path_str(NumpyPath2d(p))
+        assert d.startswith("M 0 0 l 0 0 l 10 8 l 10 8 l 10 -15 ")
+        assert d.endswith(" l 10 8 c -281 15 -291 5 -302 -15")
+
+    def test_empty_path_str(self):
+        assert svg.SVGRenderBackend.make_path_str(NumpyPath2d(None)) == ""
+
+    def test_multi_line_str(self):
+        lines = [(Vec2(0, 0), Vec2(10, 0)), (Vec2(20, 5), Vec2(20, 15))]
+        d = svg.SVGRenderBackend.make_multi_line_str(lines)
+        assert d == "M 0 0 l 10 0 m 10 5 l 0 10"
+
+    def test_multi_line_str_of_connected_lines(self):
+        lines = [
+            (Vec2(0, 0), Vec2(10, 0)),
+            (Vec2(10, 0), Vec2(10, 10)),
+            (Vec2(10, 10), Vec2(0, 10)),
+            (Vec2(20, 5), Vec2(20, 15)),
+            (Vec2(20, 15), Vec2(30, 15)),
+        ]
+        d = svg.SVGRenderBackend.make_multi_line_str(lines)
+        assert d == "M 0 0 l 10 0 0 10 -10 0 m 20 -5 l 0 10 10 0"
+
+
 def test_empty_page():
     backend_ = svg.SVGBackend()
     backend_.draw_point(Vec2(0, 0), BackendProperties())